@@ -50,11 +50,30 @@ class PDFParser(BaseParser):
         use_ocr (bool): Enable OCR for scanned PDFs. Default: True
         ocr_language (str): OCR language code. Default: 'eng'
         ocr_timeout (int): OCR timeout in seconds. Default: 300
+        ocr_colorspace (str): OCR render colorspace, 'gray', 'rgb' or
+            'binary'. Default: 'gray'
+        ocr_dpi (int): OCR render DPI. Default: 200
+        ocr_cache_dir (str|Path|None): Directory for per-page OCR results.
+            Default: None (no caching)
+        ocr_workers (int): Concurrent Tesseract processes. Default: 1
         max_pages (int): Maximum pages to process. Default: None (all pages)
         extract_images (bool): Extract images. Default: True if output_dir provided
         extract_tables (bool): Extract tables. Default: True
+        force_find_tables (bool): Run table detection on every page, even
+            for scanned PDFs. Default: False
         clean_text (bool): Apply text cleaning. Default: True
         output_dir (str|Path): Directory to save extracted images. Default: None
+        cache_dir (str|Path): Directory for caching parsed Documents. Default: None
+        text_workers (int): Worker processes for text extraction of large
+            PDFs. Default: 1 (no worker processes)
+        image_workers (int): Worker processes for image extraction of large
+            PDFs. Default: 1 (no worker processes)
+        table_workers (int): Worker processes for table detection of large
+            PDFs. Default: 1 (no worker processes)
+        reuse_document (bool): Keep opened PDFs for re-parsing the same
+            unchanged file. Default: False
+        cache_chapter_detection (bool): Reuse chapters detected for
+            identical content in earlier parses. Default: False
 
     Example:
         >>> parser = PDFParser({'use_ocr': True, 'clean_text': True})
@@ -81,9 +100,11 @@ class PDFParser(BaseParser):
         self.options.setdefault("use_ocr", True)
         self.options.setdefault("ocr_language", "eng")
         self.options.setdefault("ocr_timeout", 300)
+        self.options.setdefault("ocr_colorspace", "gray")
         self.options.setdefault("max_pages", None)
         self.options.setdefault("extract_images", True)
         self.options.setdefault("extract_tables", True)
+        self.options.setdefault("force_find_tables", False)
         self.options.setdefault("clean_text", True)
         self.options.setdefault("output_dir", None)
 
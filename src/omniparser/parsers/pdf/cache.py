@@ -0,0 +1,251 @@
+"""
+On-disk caching of parsed PDF documents and per-page OCR results.
+
+This module provides two caches keyed by a hash of the PDF file contents:
+- An opt-in Document cache keyed by file contents and parsing options.
+  Batch pipelines that reprocess the same files skip parsing entirely.
+- A per-page OCR text cache, so an interrupted or repeated OCR run only
+  re-OCRs pages that have not completed before.
+
+Functions:
+    compute_file_hash: Hash PDF file contents
+    compute_cache_key: Build a Document cache key from file contents and options
+    load_cached_document: Load a cached Document if present
+    store_cached_document: Atomically write a Document to the cache
+    load_cached_ocr_page: Load cached OCR text for a page if present
+    store_cached_ocr_page: Atomically write OCR text for a page to the cache
+
+Note:
+    Cached documents are stored with pickle. Only point cache_dir at a
+    directory you trust, since loading a pickle can execute arbitrary code.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ...models import Document
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever parse_pdf output changes shape so stale entries are ignored
+CACHE_VERSION = "2"
+# Bump whenever OCR rendering/recognition changes so stale pages are ignored
+OCR_CACHE_VERSION = "1"
+HASH_CHUNK_SIZE = 1024 * 1024  # Bytes read per hash update (1 MB)
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        file_path: Path to file.
+
+    Returns:
+        Hex digest of the file contents.
+
+    Example:
+        >>> len(compute_file_hash(Path("document.pdf")))
+        32
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def compute_cache_key(
+    file_path: Path,
+    options: Optional[Dict[str, Any]] = None,
+    output_dir: Optional[Path] = None,
+) -> str:
+    """
+    Compute cache key for a PDF file and its parsing options.
+
+    The key covers the file contents (not its path or mtime), every option
+    that can change the parsed output, the image output directory, and
+    CACHE_VERSION.
+
+    Args:
+        file_path: Path to PDF file.
+        options: Parsing options passed to parse_pdf.
+        output_dir: Image output directory passed to parse_pdf.
+
+    Returns:
+        Hex digest identifying the parse result.
+
+    Example:
+        >>> key = compute_cache_key(Path("document.pdf"), {"use_ocr": False})
+        >>> len(key)
+        32
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"v{CACHE_VERSION}\0{compute_file_hash(file_path)}".encode())
+
+    relevant_options = {k: v for k, v in (options or {}).items() if k != "cache_dir"}
+    hasher.update(f"\0{sorted(relevant_options.items())!r}".encode())
+    hasher.update(f"\0{output_dir}".encode())
+
+    return hasher.hexdigest()
+
+
+def load_cached_document(cache_dir: Path, key: str) -> Optional[Document]:
+    """
+    Load a cached Document.
+
+    Unreadable or corrupt cache entries are treated as misses.
+
+    Args:
+        cache_dir: Cache directory.
+        key: Cache key from compute_cache_key().
+
+    Returns:
+        Cached Document, or None on a cache miss.
+    """
+    cache_path = cache_dir / f"{key}.pkl"
+    if not cache_path.is_file():
+        return None
+
+    try:
+        with open(cache_path, "rb") as f:
+            document = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+        return None
+
+    if not isinstance(document, Document):
+        logger.warning(f"Ignoring invalid cache entry {cache_path}")
+        return None
+
+    return document
+
+
+def store_cached_document(cache_dir: Path, key: str, document: Document) -> None:
+    """
+    Write a Document to the cache.
+
+    The entry is written to a temporary file and renamed into place, so
+    concurrent readers never see a partial file. Write failures are logged
+    and otherwise ignored.
+
+    Args:
+        cache_dir: Cache directory (created if missing).
+        key: Cache key from compute_cache_key().
+        document: Parsed Document to cache.
+    """
+    try:
+        _write_atomic(
+            cache_dir / f"{key}.pkl",
+            pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to write PDF cache entry: {e}")
+
+
+def _ocr_page_path(
+    cache_dir: Path,
+    file_hash: str,
+    page_num: int,
+    dpi: int,
+    language: str,
+    colorspace: str,
+) -> Path:
+    """Return the cache file path for one page's OCR text."""
+    fields = (
+        f"v{OCR_CACHE_VERSION}:{file_hash}:{page_num}:{dpi}:{language}:{colorspace}"
+    )
+    key = hashlib.blake2b(fields.encode(), digest_size=16).hexdigest()
+    return cache_dir / f"{key}.txt"
+
+
+def load_cached_ocr_page(
+    cache_dir: Path,
+    file_hash: str,
+    page_num: int,
+    dpi: int,
+    language: str,
+    colorspace: str,
+) -> Optional[str]:
+    """
+    Load cached OCR text for a single page.
+
+    Args:
+        cache_dir: OCR cache directory.
+        file_hash: Hash of the PDF contents from compute_file_hash().
+        page_num: Page number (0-indexed).
+        dpi: Render DPI used for OCR.
+        language: Tesseract language code.
+        colorspace: Render colorspace used for OCR.
+
+    Returns:
+        Cached OCR text, or None on a cache miss.
+    """
+    cache_path = _ocr_page_path(
+        cache_dir, file_hash, page_num, dpi, language, colorspace
+    )
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable OCR cache entry {cache_path}: {e}")
+        return None
+
+
+def store_cached_ocr_page(
+    cache_dir: Path,
+    file_hash: str,
+    page_num: int,
+    dpi: int,
+    language: str,
+    colorspace: str,
+    text: str,
+) -> None:
+    """
+    Write OCR text for a single page to the cache.
+
+    Write failures are logged and otherwise ignored.
+
+    Args:
+        cache_dir: OCR cache directory (created if missing).
+        file_hash: Hash of the PDF contents from compute_file_hash().
+        page_num: Page number (0-indexed).
+        dpi: Render DPI used for OCR.
+        language: Tesseract language code.
+        colorspace: Render colorspace used for OCR.
+        text: OCR text for the page.
+    """
+    cache_path = _ocr_page_path(
+        cache_dir, file_hash, page_num, dpi, language, colorspace
+    )
+    try:
+        _write_atomic(cache_path, text.encode("utf-8"))
+    except Exception as e:
+        logger.warning(f"Failed to write OCR cache entry: {e}")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write bytes to path via a temporary file and rename.
+
+    Concurrent readers never see a partially written file.
+
+    Args:
+        path: Destination path (parent directories are created).
+        data: Bytes to write.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
@@ -12,19 +12,39 @@ to identify potential headings, then converts them to markdown format for
 consistent document structure.
 """
 
+import copy
+import hashlib
 import logging
-import statistics
-from typing import Dict, List, Tuple
+import math
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Sequence, Tuple, Union
 
 from ...models import Chapter
 from ...processors.chapter_detector import detect_chapters
-from .utils import DEFAULT_MAX_HEADING_WORDS, HEADING_SEARCH_WINDOW
+from .text_extraction import TextBlock
+from .utils import (
+    CHAPTER_CACHE_SIZE,
+    DEFAULT_MAX_HEADING_WORDS,
+    HEADING_ANCHOR_SLACK,
+    HEADING_SEARCH_WINDOW,
+)
 
 logger = logging.getLogger(__name__)
 
+# Offsets from a heading's recorded position to test, nearest first
+_ANCHOR_OFFSETS = tuple(
+    sorted(range(-HEADING_ANCHOR_SLACK, HEADING_ANCHOR_SLACK + 1), key=abs)
+)
+
+# Chapters keyed by (content digest, min_level, max_level), least recent first
+_chapter_cache: "OrderedDict[Tuple[bytes, int, int], List[Chapter]]" = OrderedDict()
+_chapter_cache_lock = threading.Lock()
+
 
 def detect_headings_from_fonts(
-    text_blocks: List[Dict], max_heading_words: int = DEFAULT_MAX_HEADING_WORDS
+    text_blocks: Sequence[Union[TextBlock, Dict]],
+    max_heading_words: int = DEFAULT_MAX_HEADING_WORDS,
 ) -> List[Tuple[str, int, int]]:
     """
     Detect headings based on font size analysis.
@@ -37,7 +57,8 @@ def detect_headings_from_fonts(
     5. Map font sizes to heading levels (1-6)
 
     Args:
-        text_blocks: List of text blocks with font info (font_size, is_bold, text, position).
+        text_blocks: Text blocks with font info (font_size, is_bold, text,
+            position), as TextBlocks or dicts with those keys.
         max_heading_words: Maximum words in a heading (default: 25).
 
     Returns:
@@ -54,36 +75,47 @@ def detect_headings_from_fonts(
     """
     if not text_blocks:
         return []
+    text_blocks = as_text_blocks(text_blocks)
+
+    # A single font size without bold text has no structure to detect (and
+    # with std_dev = 0 every block would reach the threshold). all() stops
+    # at the first differing block, so structured documents pay little.
+    first_size = text_blocks[0].font_size
+    if all(
+        block.font_size == first_size and not block.is_bold for block in text_blocks
+    ):
+        logger.info("Font analysis: uniform font size, no headings")
+        return []
 
-    # Calculate font size statistics
-    font_sizes = [block["font_size"] for block in text_blocks]
-    avg_size = statistics.mean(font_sizes)
-    std_dev = statistics.stdev(font_sizes) if len(font_sizes) > 1 else 0.0
+    # Calculate font size statistics from a histogram of the sizes. Documents
+    # use only a handful of distinct sizes, so Counter() (which counts in C)
+    # leaves a few terms per reduction instead of one per span
+    font_sizes = [block.font_size for block in text_blocks]
+    size_counts = Counter(font_sizes)
+    avg_size, std_dev = font_size_statistics(size_counts)
 
     # Determine heading threshold (configurable or auto-detect)
     min_heading_size = avg_size + (1.5 * std_dev)
 
     # Find headings
     headings = []
-    unique_sizes = sorted(set(font_sizes), reverse=True)
-
-    for block in text_blocks:
-        # Refined heuristic: heading must meet one of these criteria:
-        # 1. Font size above threshold
-        # 2. Bold AND font size above average (not just any bold text)
-        is_heading_candidate = block["font_size"] >= min_heading_size or (
-            block["is_bold"] and block["font_size"] > avg_size
-        )
-
-        if is_heading_candidate:
-            # Only consider lines with reasonable length for headings
-            text = block["text"].strip()
-            word_count = len(text.split())
-            # Headings are typically 1-N words (configurable)
-            if 1 <= word_count <= max_heading_words:
-                # Map font size to heading level
-                level = map_font_size_to_level(block["font_size"], unique_sizes)
-                headings.append((text, level, block["position"]))
+    level_map = build_font_size_level_map(sorted(size_counts, reverse=True))
+    bold_flags = [block.is_bold for block in text_blocks]
+
+    for index in select_heading_indices(
+        font_sizes, bold_flags, min_heading_size, avg_size
+    ):
+        block = text_blocks[index]
+        # Only consider lines with reasonable length for headings
+        text = block.text.strip()
+        # Splitting at most max_heading_words times stops early on long
+        # paragraphs; more words than that leave an extra (remainder) item
+        word_count = len(text.split(None, max_heading_words))
+        # Headings are typically 1-N words (configurable)
+        if 1 <= word_count <= max_heading_words:
+            # Map font size to heading level
+            level = level_map.get(block.font_size, 3)
+            headings.append((text, level, block.position))
 
     logger.info(
         f"Font analysis: avg={avg_size:.1f}, std={std_dev:.1f}, "
@@ -93,6 +125,127 @@ def detect_headings_from_fonts(
     return headings
 
 
+def as_text_blocks(
+    text_blocks: Sequence[Union[TextBlock, Dict]],
+) -> Sequence[TextBlock]:
+    """
+    Convert dict text blocks to TextBlocks; TextBlock lists pass through.
+
+    Only the first block is checked, so lists must not mix the two. Dicts
+    without a page_num get page 0.
+
+    Args:
+        text_blocks: Non-empty sequence of TextBlocks or dicts with the
+            text, font_size, is_bold and position keys.
+
+    Returns:
+        Sequence of TextBlocks.
+
+    Example:
+        >>> block = {"text": "Hi", "font_size": 12.0, "is_bold": False, "position": 0}
+        >>> as_text_blocks([block])
+        [TextBlock(text='Hi', font_size=12.0, is_bold=False, page_num=0, position=0)]
+    """
+    if isinstance(text_blocks[0], TextBlock):
+        return text_blocks  # type: ignore[return-value]
+    return [
+        TextBlock(
+            block["text"],
+            block["font_size"],
+            block["is_bold"],
+            block.get("page_num", 0),
+            block["position"],
+        )
+        for block in text_blocks
+    ]
+
+
+def font_size_statistics(size_counts: Counter) -> Tuple[float, float]:
+    """
+    Compute the mean and sample standard deviation of font sizes.
+
+    Takes the sizes as a histogram (size -> number of blocks), so the cost
+    depends on the number of distinct sizes rather than blocks. Sums use
+    math.fsum() and match statistics.fmean() / stdev() on the expanded list.
+
+    Args:
+        size_counts: Number of blocks with each font size.
+
+    Returns:
+        Tuple of (average size, standard deviation); the deviation is 0.0
+        for fewer than two blocks.
+
+    Example:
+        >>> font_size_statistics(Counter({12.0: 3, 18.0: 1}))
+        (13.5, 3.0)
+    """
+    total = sum(size_counts.values())
+    avg_size = math.fsum(size * count for size, count in size_counts.items()) / total
+    if total < 2:
+        return avg_size, 0.0
+    squared_deviations = math.fsum(
+        (size - avg_size) ** 2 * count for size, count in size_counts.items()
+    )
+    return avg_size, math.sqrt(squared_deviations / (total - 1))
+
+
+def select_heading_indices(
+    font_sizes: List[float],
+    bold_flags: List[bool],
+    min_heading_size: float,
+    avg_size: float,
+) -> List[int]:
+    """
+    Select indices of blocks whose font metrics qualify them as headings.
+
+    Refined heuristic: a block is a heading candidate if either
+    1. its font size is at or above the heading threshold, or
+    2. it is bold AND its font size is above average (not just any bold text).
+
+    Works on parallel columns rather than block dicts so the numeric filter
+    runs as a single comprehension, before any per-block text processing.
+
+    Args:
+        font_sizes: Font size of each block.
+        bold_flags: Bold flag of each block (same order as font_sizes).
+        min_heading_size: Font size threshold for headings.
+        avg_size: Average font size across the document.
+
+    Returns:
+        Indices of candidate blocks, in document order.
+
+    Example:
+        >>> select_heading_indices([18.0, 12.0, 13.0], [False, False, True], 16.0, 12.5)
+        [0, 2]
+    """
+    return [
+        index
+        for index, (size, bold) in enumerate(zip(font_sizes, bold_flags))
+        if size >= min_heading_size or (bold and size > avg_size)
+    ]
+
+
+def build_font_size_level_map(unique_sizes: List[float]) -> Dict[float, int]:
+    """
+    Map every font size to its heading level (1-6) in one pass.
+
+    Gives the same levels as map_font_size_to_level(), but as a dict built
+    once per document, so each heading costs a lookup rather than a scan
+    of the unique sizes.
+
+    Args:
+        unique_sizes: Sorted list of unique font sizes (descending).
+
+    Returns:
+        Dict of font size -> heading level.
+
+    Example:
+        >>> build_font_size_level_map([24.0, 18.0, 14.0])
+        {24.0: 1, 18.0: 2, 14.0: 3}
+    """
+    return {size: min(position + 1, 6) for position, size in enumerate(unique_sizes)}
+
+
 def map_font_size_to_level(font_size: float, unique_sizes: List[float]) -> int:
     """
     Map font size to heading level (1-6).
@@ -135,6 +288,9 @@ def convert_headings_to_markdown(
     - etc.
 
     Uses position-based replacement to avoid replacing wrong occurrences.
+    Recorded positions are normally exact, so the heading is first matched
+    in place (within HEADING_ANCHOR_SLACK characters) before searching a
+    HEADING_SEARCH_WINDOW around it.
 
     Args:
         text: Original text.
@@ -153,50 +309,53 @@ def convert_headings_to_markdown(
     if not headings:
         return text
 
-    # Sort headings by position (descending) to process from end to start
-    # This avoids position offset issues when modifying the string
-    sorted_headings = sorted(headings, key=lambda x: x[2], reverse=True)
-
-    result = text
-    for heading_text, level, approx_position in sorted_headings:
-        # Create markdown heading
-        markdown_heading = f"\n{'#' * level} {heading_text}\n"
-
-        # Search for the heading text near the approximate position
-        # Use a window around the position to account for minor discrepancies
-        search_start = max(0, approx_position - HEADING_SEARCH_WINDOW)
-        search_end = min(
-            len(result), approx_position + len(heading_text) + HEADING_SEARCH_WINDOW
-        )
-        search_region = result[search_start:search_end]
-
-        # Find the heading text in the search region
-        heading_index = search_region.find(heading_text)
-
-        if heading_index != -1:
-            # Calculate actual position in the full text
-            actual_position = search_start + heading_index
-
-            # Replace at the specific position
-            result = (
-                result[:actual_position]
-                + markdown_heading
-                + result[actual_position + len(heading_text) :]
-            )
-        else:
-            # Fallback: use simple replacement if position-based fails
-            # This handles cases where spacing might have changed
+    # Walk the text once in position order, collecting the unchanged text
+    # between headings and joining once at the end; rebuilding the whole
+    # string per heading would cost O(headings * length)
+    parts = []
+    cursor = 0  # End of the last replaced heading in text
+    for heading_text, level, approx_position in sorted(headings, key=lambda x: x[2]):
+        # Match the heading at (or a few characters from) its position;
+        # startswith() compares in place without copying a substring
+        actual_position = -1
+        for offset in _ANCHOR_OFFSETS:
+            position = approx_position + offset
+            # Matches may not overlap the previous heading's replacement
+            if position >= cursor and text.startswith(heading_text, position):
+                actual_position = position
+                break
+
+        if actual_position == -1:
+            # Search a window around the position to account for larger
+            # discrepancies (bounded find() avoids slicing the window out)
+            search_start = max(cursor, approx_position - HEADING_SEARCH_WINDOW)
+            search_end = approx_position + len(heading_text) + HEADING_SEARCH_WINDOW
+            actual_position = text.find(heading_text, search_start, search_end)
+
+        if actual_position == -1:
+            # Fallback: use the next occurrence if position-based matching
+            # fails. This handles cases where spacing might have changed
             logger.debug(
                 f"Position-based replacement failed for '{heading_text}', "
                 f"using fallback"
             )
-            result = result.replace(heading_text, markdown_heading, 1)
+            actual_position = text.find(heading_text, cursor)
+            if actual_position == -1:
+                continue
 
-    return result
+        parts.append(text[cursor:actual_position])
+        parts.append(f"\n{'#' * level} {heading_text}\n")
+        cursor = actual_position + len(heading_text)
+
+    parts.append(text[cursor:])
+    return "".join(parts)
 
 
 def detect_chapters_from_content(
-    markdown_content: str, min_level: int = 1, max_level: int = 3
+    markdown_content: str,
+    min_level: int = 1,
+    max_level: int = 3,
+    use_cache: bool = False,
 ) -> List[Chapter]:
     """
     Detect chapters from markdown headings.
@@ -204,10 +363,18 @@ def detect_chapters_from_content(
     Uses the shared chapter_detector processor to identify chapters
     based on markdown heading levels.
 
+    With use_cache, results for the last CHAPTER_CACHE_SIZE contents are
+    kept, keyed by a BLAKE2 digest of the content (so whole documents are
+    not held as keys). Re-parsing identical content then costs a hash and
+    a copy instead of a full detection pass; callers always receive their
+    own Chapter objects.
+
     Args:
         markdown_content: Markdown text with headings.
         min_level: Minimum heading level for chapters (default: 1).
         max_level: Maximum heading level for chapters (default: 3).
+        use_cache: Reuse chapters detected earlier for identical content
+            (default: False).
 
     Returns:
         List of Chapter objects.
@@ -218,21 +385,53 @@ def detect_chapters_from_content(
         >>> len(chapters)
         2
     """
+    if not use_cache:
+        chapters = detect_chapters(
+            markdown_content, min_level=min_level, max_level=max_level
+        )
+        logger.info(f"Detected {len(chapters)} chapters")
+        return chapters
+
+    digest = hashlib.blake2b(markdown_content.encode("utf-8"), digest_size=16).digest()
+    key = (digest, min_level, max_level)
+
+    with _chapter_cache_lock:
+        cached = _chapter_cache.get(key)
+        if cached is not None:
+            _chapter_cache.move_to_end(key)
+
+    if cached is not None:
+        logger.info(f"Reusing {len(cached)} detected chapters")
+        return copy.deepcopy(cached)
+
     chapters = detect_chapters(
         markdown_content, min_level=min_level, max_level=max_level
     )
-
     logger.info(f"Detected {len(chapters)} chapters")
 
+    with _chapter_cache_lock:
+        # Store a copy so callers modifying their chapters can't alter it
+        _chapter_cache[key] = copy.deepcopy(chapters)
+        _chapter_cache.move_to_end(key)
+        while len(_chapter_cache) > CHAPTER_CACHE_SIZE:
+            _chapter_cache.popitem(last=False)
+
     return chapters
 
 
+def clear_chapter_cache() -> None:
+    """Drop all chapters kept by detect_chapters_from_content()."""
+    with _chapter_cache_lock:
+        _chapter_cache.clear()
+
+
 def process_pdf_headings(
-    text_blocks: List[Dict],
+    text_blocks: Sequence[Union[TextBlock, Dict]],
     content: str,
     max_heading_words: int = DEFAULT_MAX_HEADING_WORDS,
     min_chapter_level: int = 1,
     max_chapter_level: int = 3,
+    cache_chapters: bool = False,
 ) -> Tuple[str, List[Chapter]]:
     """
     Main coordinator for PDF heading detection and processing.
@@ -243,11 +442,13 @@ def process_pdf_headings(
     3. Detect chapters from markdown headings
 
     Args:
-        text_blocks: List of text blocks with font info.
+        text_blocks: Text blocks with font info (TextBlocks or dicts).
         content: Original text content.
         max_heading_words: Maximum words in a heading (default: 25).
         min_chapter_level: Minimum heading level for chapters (default: 1).
         max_chapter_level: Maximum heading level for chapters (default: 3).
+        cache_chapters: Reuse chapters detected earlier for identical
+            markdown content (default: False).
 
     Returns:
         Tuple of (markdown_content, chapters).
@@ -277,7 +478,10 @@ def process_pdf_headings(
 
     # Step 3: Detect chapters from markdown
     chapters = detect_chapters_from_content(
-        markdown_content, min_level=min_chapter_level, max_level=max_chapter_level
+        markdown_content,
+        min_level=min_chapter_level,
+        max_level=max_chapter_level,
+        use_cache=cache_chapters,
     )
 
     return markdown_content, chapters
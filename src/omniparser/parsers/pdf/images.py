@@ -11,10 +11,14 @@ Functions:
     scan_pdf_for_qr_codes: Scan all PDF pages for QR codes
 """
 
+import hashlib
 import logging
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import fitz  # PyMuPDF
 from PIL import Image
@@ -27,15 +31,32 @@ from ...processors.image_extractor import (
     validate_image_data,
 )
 from ...processors.qr_detector import detect_qr_codes_from_pil, is_qr_detection_available
-from .utils import MIN_IMAGE_SIZE
+from .utils import (
+    MIN_IMAGE_SIZE,
+    PARALLEL_IMAGE_MIN_PAGES,
+    PARALLEL_IMAGE_RANGE_PAGES,
+    quiet_mupdf_errors,
+    trim_mupdf_store,
+)
 
 logger = logging.getLogger(__name__)
 
+# (image bytes, extension, width, height) of one extracted image; width and
+# height are None when PyMuPDF does not report them
+_ExtractedImage = Tuple[bytes, str, Optional[int], Optional[int]]
+
+# Images already handled in a document: xref -> first ImageReference (None if
+# skipped or failed), and content digest -> ImageReference of the saved file
+_ImageMemo = Dict[Union[int, bytes], Optional[ImageReference]]
 
+
+@quiet_mupdf_errors()
 def extract_pdf_images(
     doc: fitz.Document,
     output_dir: Optional[Path] = None,
     max_images: Optional[int] = None,
+    file_path: Optional[Path] = None,
+    workers: int = 1,
 ) -> List[ImageReference]:
     """
     Extract embedded images from PDF document.
@@ -43,15 +64,32 @@ def extract_pdf_images(
     Process:
     1. Iterate through pages
     2. Get image list: page.get_images()
-    3. Extract image data: doc.extract_image(xref)
-    4. Validate using MIN_IMAGE_SIZE filter
-    5. Save using shared image_extractor utility
-    6. Create ImageReference objects
+    3. Skip images below MIN_IMAGE_SIZE using the listed dimensions
+    4. Extract image data: doc.extract_image(xref), once per xref
+    5. Validate using MIN_IMAGE_SIZE filter
+    6. Save using shared image_extractor utility
+    7. Create ImageReference objects
+
+    Images shared by several pages (logos, headers) are stored once per
+    document: later pages get their own ImageReference pointing at the
+    already saved file instead of decoding and saving the image again.
+
+    With workers > 1 and the document's file_path, steps 2-4 (decoding
+    image streams in MuPDF) run in worker processes over contiguous page
+    ranges, each with its own copy of the document. Validation, saving,
+    numbering and the max_images limit stay in this process, so results
+    match sequential extraction. Ranges are saved as they arrive, with a
+    bounded number in flight, so memory holds a few ranges' decoded images
+    rather than the whole document's. Each worker gets at least
+    PARALLEL_IMAGE_MIN_PAGES pages; shorter documents stay in-process.
 
     Args:
         doc: PyMuPDF document object.
         output_dir: Directory for extracted images. If None, uses temp directory.
-        max_images: Maximum number of images to extract. If None, extracts all.
+        max_images: Maximum number of images to extract. If None, extracts
+            all; 0 extracts none.
+        file_path: Path the document was opened from (needed for workers).
+        workers: Number of worker processes (default: 1 = in-process).
 
     Returns:
         List of ImageReference objects with image metadata.
@@ -63,6 +101,11 @@ def extract_pdf_images(
         >>> print(f"Extracted {len(images)} images")
         >>> doc.close()
     """
+    if max_images == 0:
+        # Return before creating any directory or walking the pages
+        logger.info("max_images is 0, skipping image extraction")
+        return []
+
     images = []
     temp_dir_obj = None
 
@@ -75,7 +118,16 @@ def extract_pdf_images(
         output_dir = Path(temp_dir_obj.name)
 
     try:
+        workers = min(workers, len(doc) // PARALLEL_IMAGE_MIN_PAGES)
+        if workers > 1 and file_path is not None:
+            images = _save_images_from_processes(
+                file_path, len(doc), workers, output_dir, max_images
+            )
+            logger.info(f"Extracted {len(images)} images")
+            return images
+
         image_counter = 0
+        seen_images: _ImageMemo = {}
 
         for page_num in range(len(doc)):
             # Check if we've reached the image limit
@@ -87,9 +139,10 @@ def extract_pdf_images(
 
             page = doc[page_num]
             page_images, image_counter = extract_page_images(
-                page, page_num, output_dir, image_counter, doc, max_images
+                page, page_num, output_dir, image_counter, doc, max_images, seen_images
             )
             images.extend(page_images)
+            trim_mupdf_store(page_num + 1)
 
         logger.info(f"Extracted {len(images)} images")
         return images
@@ -107,6 +160,7 @@ def extract_page_images(
     counter: int,
     doc: fitz.Document,
     max_images: Optional[int] = None,
+    seen_images: Optional[_ImageMemo] = None,
 ) -> Tuple[List[ImageReference], int]:
     """
     Extract images from a single PDF page.
@@ -118,6 +172,9 @@ def extract_page_images(
         counter: Starting counter for image numbering.
         doc: PyMuPDF document object (for extract_image call).
         max_images: Maximum total images to extract (for limit checking).
+        seen_images: Memo of images already handled, shared across pages so
+            repeated images are extracted and saved once. A fresh memo is
+            used if None.
 
     Returns:
         Tuple of (list of ImageReference objects, updated counter).
@@ -131,6 +188,8 @@ def extract_page_images(
     """
     images = []
     image_list = page.get_images()
+    if seen_images is None:
+        seen_images = {}
 
     for img_index, img in enumerate(image_list):
         # Check if we've reached the image limit
@@ -138,58 +197,302 @@ def extract_page_images(
             break
 
         try:
-            xref = img[0]
-            base_image = doc.extract_image(xref)
+            img_ref, counter = _save_or_reference_image(
+                img[0],
+                lambda: _extract_listed_image(doc, img, page_num),
+                seen_images,
+                page_num,
+                img_index,
+                output_dir,
+                counter,
+            )
+            if img_ref is not None:
+                images.append(img_ref)
 
-            if not base_image:
-                continue
+        except Exception as e:
+            logger.warning(
+                f"Failed to extract image {img_index} on page {page_num + 1}: {e}"
+            )
 
-            image_data = base_image["image"]
-            image_ext = base_image["ext"]
+    return images, counter
 
-            # Validate image data using shared utility
-            is_valid, error = validate_image_data(image_data, min_size=MIN_IMAGE_SIZE)
-            if not is_valid:
-                logger.debug(f"Skipping invalid image on page {page_num + 1}: {error}")
-                continue
 
-            # Increment counter
-            counter += 1
+def _extract_listed_image(
+    doc: fitz.Document, img: tuple, page_num: int
+) -> Optional[_ExtractedImage]:
+    """
+    Extract one page.get_images() entry as (image bytes, extension, size).
 
-            # Save image using shared utility
-            image_path, format_name = save_image(
-                image_data,
-                output_dir,
-                base_name="img",
-                extension=image_ext,
-                counter=counter,
-            )
+    Returns None for images too small to keep or without data.
+    """
+    xref, _, width, height = img[:4]
+    # get_images() lists each image's pixel size, so tiny decorative
+    # images are skipped before extract_image() reads (and for
+    # non-JPEG streams, re-encodes) them
+    if width < MIN_IMAGE_SIZE or height < MIN_IMAGE_SIZE:
+        logger.debug(f"Skipping small image on page {page_num + 1}")
+        return None
+
+    base_image = doc.extract_image(xref)
+    if not base_image:
+        return None
+    return (
+        base_image["image"],
+        base_image["ext"],
+        base_image.get("width"),
+        base_image.get("height"),
+    )
+
+
+def _save_extracted_image(
+    extracted: _ExtractedImage,
+    page_num: int,
+    img_index: int,
+    output_dir: Path,
+    counter: int,
+) -> Tuple[Optional[ImageReference], int]:
+    """
+    Validate and save one extracted image.
 
-            # Get image dimensions using shared utility
-            width, height, detected_format = get_image_dimensions(image_data)
-            if detected_format != "unknown":
-                format_name = detected_format
-
-            # Create ImageReference
-            img_ref = ImageReference(
-                image_id=f"img_{counter:04d}",
-                position=page_num * 1000 + img_index,  # Approximate position
-                file_path=str(image_path),
-                alt_text=f"Image on page {page_num + 1}",
-                size=(width, height) if width and height else None,
-                format=format_name,
-            )
+    Returns:
+        Tuple of (ImageReference, or None if the image is invalid, and the
+        updated counter).
+    """
+    image_data, image_ext, width, height = extracted
+
+    # Validate image data using shared utility
+    is_valid, error = validate_image_data(image_data, min_size=MIN_IMAGE_SIZE)
+    if not is_valid:
+        logger.debug(f"Skipping invalid image on page {page_num + 1}: {error}")
+        return None, counter
+
+    # Increment counter
+    counter += 1
+
+    # Save image using shared utility
+    image_path, format_name = save_image(
+        image_data,
+        output_dir,
+        base_name="img",
+        extension=image_ext,
+        counter=counter,
+    )
+
+    # extract_image() reports the stream's size and format; only decode the
+    # image header with PIL when it does not
+    if not (width and height):
+        width, height, detected_format = get_image_dimensions(image_data)
+        if detected_format != "unknown":
+            format_name = detected_format
+
+    # Create ImageReference
+    img_ref = ImageReference(
+        image_id=f"img_{counter:04d}",
+        position=page_num * 1000 + img_index,  # Approximate position
+        file_path=str(image_path),
+        alt_text=f"Image on page {page_num + 1}",
+        size=(width, height) if width and height else None,
+        format=format_name,
+    )
+    return img_ref, counter
+
+
+def _save_or_reference_image(
+    xref: int,
+    extract: Callable[[], Optional[_ExtractedImage]],
+    seen_images: _ImageMemo,
+    page_num: int,
+    img_index: int,
+    output_dir: Path,
+    counter: int,
+) -> Tuple[Optional[ImageReference], int]:
+    """
+    Save an image the first time it is seen, else reuse the saved file.
 
-            images.append(img_ref)
+    Images are matched by xref, and after extraction by content, which
+    catches identical images stored under several xrefs (e.g. a logo in
+    PDFs merged from separately produced files).
 
-        except Exception as e:
-            logger.warning(
-                f"Failed to extract image {img_index} on page {page_num + 1}: {e}"
+    Args:
+        xref: Image xref from page.get_images().
+        extract: Returns (image bytes, extension, size), or None to skip; only
+            called for xrefs not seen before.
+        seen_images: Memo of images already handled.
+        page_num: Page number (0-indexed).
+        img_index: Index of the image in the page's image list.
+        output_dir: Directory to save images.
+        counter: Current image counter.
+
+    Returns:
+        Tuple of (ImageReference, or None if the image is skipped, and the
+        updated counter).
+    """
+    if xref in seen_images:
+        first_ref = seen_images[xref]
+        if first_ref is None:
+            return None, counter
+        return _reference_saved_image(first_ref, page_num, img_index, counter)
+
+    # Recorded as skipped up front so an image that fails to decode or save
+    # is not retried on every page that shows it
+    seen_images[xref] = None
+    extracted = extract()
+    if extracted is None:
+        return None, counter
+
+    digest = hashlib.blake2b(extracted[0], digest_size=16).digest()
+    saved_ref = seen_images.get(digest)
+    if saved_ref is not None:
+        img_ref, counter = _reference_saved_image(
+            saved_ref, page_num, img_index, counter
+        )
+    else:
+        img_ref, counter = _save_extracted_image(
+            extracted, page_num, img_index, output_dir, counter
+        )
+        if img_ref is not None:
+            seen_images[digest] = img_ref
+    seen_images[xref] = img_ref
+    return img_ref, counter
+
+
+def _reference_saved_image(
+    saved_ref: ImageReference, page_num: int, img_index: int, counter: int
+) -> Tuple[ImageReference, int]:
+    """Create a new ImageReference for another occurrence of a saved image."""
+    counter += 1
+    img_ref = replace(
+        saved_ref,
+        image_id=f"img_{counter:04d}",
+        position=page_num * 1000 + img_index,  # Approximate position
+        alt_text=f"Image on page {page_num + 1}",
+    )
+    return img_ref, counter
+
+
+def _extract_image_range(
+    file_path: str, start: int, end: int, skip_xrefs: FrozenSet[int] = frozenset()
+) -> List[List[Tuple[int, int, Optional[_ExtractedImage]]]]:
+    """
+    Worker process entry point: extract listed images of pages [start, end).
+
+    Returns (img_index, xref, extracted) per listed image; extracted is None
+    for images skipped, in skip_xrefs (already handled by the caller), or
+    already extracted earlier in the range.
+    """
+    pages = []
+    seen_xrefs = set(skip_xrefs)
+    with fitz.open(file_path) as doc:
+        for page_num in range(start, end):
+            page_images = []
+            for img_index, img in enumerate(doc[page_num].get_images()):
+                xref = img[0]
+                extracted = None
+                if xref not in seen_xrefs:
+                    seen_xrefs.add(xref)
+                    try:
+                        extracted = _extract_listed_image(doc, img, page_num)
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to extract image {img_index} on page "
+                            f"{page_num + 1}: {e}"
+                        )
+                        continue
+                page_images.append((img_index, xref, extracted))
+            pages.append(page_images)
+            trim_mupdf_store(page_num - start + 1)
+    return pages
+
+
+def _save_images_from_processes(
+    file_path: Path,
+    num_pages: int,
+    workers: int,
+    output_dir: Path,
+    max_images: Optional[int],
+) -> List[ImageReference]:
+    """
+    Extract images with a process pool and save them in page order.
+
+    Pages are handed out in PARALLEL_IMAGE_RANGE_PAGES ranges, at most two
+    per worker in flight. Each range skips xrefs already seen in earlier
+    ranges, so images shared across the document are mostly decoded once.
+
+    Args:
+        file_path: Path to PDF file (each worker opens its own copy).
+        num_pages: Number of pages in the document.
+        workers: Number of worker processes.
+        output_dir: Directory to save images.
+        max_images: Maximum number of images to save (None = all).
+
+    Returns:
+        List of ImageReference objects, numbered as sequential extraction.
+    """
+    logger.info(f"Extracting images from {num_pages} pages with {workers} processes")
+    images: List[ImageReference] = []
+    counter = 0
+    seen_images: _ImageMemo = {}
+
+    def collect(page_num: int, future: Future) -> bool:
+        """Save one range's images; False once max_images is reached."""
+        nonlocal counter
+        for page_images in future.result():
+            for img_index, xref, extracted in page_images:
+                if max_images and counter >= max_images:
+                    logger.info(
+                        f"Reached max_images limit ({max_images}), "
+                        f"stopping extraction"
+                    )
+                    return False
+                try:
+                    img_ref, counter = _save_or_reference_image(
+                        xref,
+                        lambda: extracted,
+                        seen_images,
+                        page_num,
+                        img_index,
+                        output_dir,
+                        counter,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to extract image {img_index} on page "
+                        f"{page_num + 1}: {e}"
+                    )
+                    continue
+                if img_ref is not None:
+                    images.append(img_ref)
+            page_num += 1
+        return True
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: Deque[Tuple[int, Future]] = deque()
+        for start in range(0, num_pages, PARALLEL_IMAGE_RANGE_PAGES):
+            # Bound decoded-but-unsaved images held in memory
+            while len(in_flight) >= 2 * workers:
+                if not collect(*in_flight.popleft()):
+                    # Don't start ranges that are still queued
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    return images
+
+            end = min(start + PARALLEL_IMAGE_RANGE_PAGES, num_pages)
+            future = pool.submit(
+                _extract_image_range,
+                str(file_path),
+                start,
+                end,
+                frozenset(key for key in seen_images if isinstance(key, int)),
             )
+            in_flight.append((start, future))
 
-    return images, counter
+        while in_flight:
+            if not collect(*in_flight.popleft()):
+                pool.shutdown(wait=False, cancel_futures=True)
+                break
+    return images
 
 
+@quiet_mupdf_errors()
 def scan_pdf_for_qr_codes(
     doc: fitz.Document,
     dpi: int = 150,
@@ -248,6 +551,7 @@ def scan_pdf_for_qr_codes(
 
             # Render page to pixmap
             pixmap = page.get_pixmap(matrix=matrix)
+            trim_mupdf_store(page_num + 1)
 
             # Convert to PIL Image
             img_data = pixmap.tobytes("png")
@@ -16,20 +16,39 @@ while maintaining a clean, linear flow.
 
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from ...models import Chapter, Document, ImageReference, Metadata, ProcessingInfo, QRCodeReference
+from ...models import Document, ImageReference, ProcessingInfo, QRCodeReference
+from ...processors.qr_content_merger import (
+    merge_qr_content_to_document,
+    process_qr_codes,
+)
 from ...processors.text_cleaner import clean_text
-from ...processors.qr_content_merger import process_qr_codes, merge_qr_content_to_document
+from .cache import (
+    compute_cache_key,
+    compute_file_hash,
+    load_cached_document,
+    store_cached_document,
+)
 from .heading_detection import process_pdf_headings
 from .images import extract_pdf_images, scan_pdf_for_qr_codes
 from .metadata import extract_pdf_metadata
 from .tables import extract_pdf_tables
-from .text_extraction import extract_text_content
-from .utils import count_words, estimate_reading_time
-from .validation import validate_and_load_pdf
+from .text_extraction import extract_text_content, is_scanned_pdf
+from .utils import (
+    OCR_DPI,
+    count_words,
+    estimate_reading_time,
+)
+from .validation import (
+    close_pdf_document,
+    load_cached_pdf_document,
+    validate_and_load_pdf,
+    validate_pdf_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,11 +65,12 @@ def parse_pdf(
     parsing pipeline:
     1. Validate and load PDF file
     2. Extract metadata
-    3. Extract text (with OCR for scanned PDFs)
-    4. Detect headings and chapters
-    5. Extract images (if output_dir provided)
-    6. Extract tables
-    7. Build Document with all extracted data
+    3. Scan for QR codes (URL content is fetched in the background)
+    4. Extract text (with OCR for scanned PDFs)
+    5. Detect headings and chapters
+    6. Extract images (if output_dir provided)
+    7. Extract tables
+    8. Build Document with all extracted data
 
     Args:
         file_path: Path to PDF file to parse.
@@ -60,15 +80,42 @@ def parse_pdf(
             - use_ocr: Enable OCR for scanned PDFs (default: True)
             - ocr_language: OCR language code (default: 'eng')
             - ocr_timeout: OCR timeout in seconds (default: 300)
+            - ocr_colorspace: OCR render colorspace, 'gray', 'rgb' or 'binary'
+              (default: 'gray')
+            - ocr_dpi: OCR render DPI; raise for very small print (default: 200)
+            - ocr_cache_dir: Directory for per-page OCR results, reused on
+              re-runs; entries are never evicted (default: None = no caching)
+            - ocr_workers: Concurrent Tesseract processes; sets
+              OMP_THREAD_LIMIT=1 during OCR unless already set when above 1
+              (default: 1)
             - max_pages: Maximum pages to process (default: None = all)
             - extract_images: Extract images (default: True if output_dir provided)
             - extract_tables: Extract tables (default: True)
+            - force_find_tables: Run table detection on every page, even for
+              scanned PDFs and pages without text or drawings (default: False)
             - clean_text: Apply text cleaning (default: True)
             - detect_qr_codes: Scan for QR codes in PDF (default: False)
             - qr_fetch_urls: Fetch content from QR code URLs (default: True)
             - qr_timeout: Timeout for QR URL fetching in seconds (default: 15)
             - qr_dpi: DPI for rendering pages for QR detection (default: 150)
             - max_qr_scan_pages: Max pages to scan for QR codes (default: None = all)
+            - cache_dir: Directory for caching parsed Documents keyed by file
+              contents and options (default: None = no caching)
+            - mmap_load: Memory-map PDFs of 1 MB or more when loading; the
+              file must not be truncated while parsing (default: False)
+            - text_workers: Worker processes for text extraction of large
+              text-based PDFs (default: 1 = no worker processes)
+            - image_workers: Worker processes for image extraction of large
+              PDFs (default: 1 = no worker processes)
+            - table_workers: Worker processes for table detection of large
+              PDFs (default: 1 = no worker processes)
+            - reuse_document: Keep the opened PDF for later parse_pdf calls
+              on the same unchanged file, skipping re-parsing its structure.
+              Not safe when parsing the same file from several threads
+              (default: False)
+            - cache_chapter_detection: Reuse chapters detected for identical
+              content in earlier parses, keyed by a content hash
+              (default: False)
 
     Returns:
         Document object with parsed content, metadata, and processing info.
@@ -92,83 +139,159 @@ def parse_pdf(
     use_ocr = options.get("use_ocr", True)
     ocr_language = options.get("ocr_language", "eng")
     ocr_timeout = options.get("ocr_timeout", 300)
+    ocr_colorspace = options.get("ocr_colorspace", "gray")
+    ocr_dpi = options.get("ocr_dpi", OCR_DPI)
+    ocr_cache_dir = options.get("ocr_cache_dir")
     max_pages = options.get("max_pages")
     extract_images_flag = options.get("extract_images", output_dir is not None)
     extract_tables_flag = options.get("extract_tables", True)
+    force_find_tables = options.get("force_find_tables", False)
     clean_text_flag = options.get("clean_text", True)
     detect_qr_codes_flag = options.get("detect_qr_codes", False)
     qr_fetch_urls = options.get("qr_fetch_urls", True)
     qr_timeout = options.get("qr_timeout", 15)
     qr_dpi = options.get("qr_dpi", 150)
     max_qr_scan_pages = options.get("max_qr_scan_pages")
+    cache_dir = options.get("cache_dir")
+    mmap_load = options.get("mmap_load", False)
+    reuse_document = options.get("reuse_document", False)
+    text_workers = options.get("text_workers", 1)
+    ocr_workers = options.get("ocr_workers", 1)
+    image_workers = options.get("image_workers", 1)
+    table_workers = options.get("table_workers", 1)
+    cache_chapter_detection = options.get("cache_chapter_detection", False)
+
+    # Return cached result if this exact file/options pair was parsed before
+    cache_key = None
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        validate_pdf_file(file_path)
+        cache_key = compute_cache_key(file_path, options, output_dir)
+        cached_document = load_cached_document(cache_dir, cache_key)
+        if cached_document is not None:
+            logger.info(f"Using cached parse result for: {file_path}")
+            return cached_document
 
     # Step 1: Validate and load PDF
     logger.info(f"Loading PDF: {file_path}")
-    doc = validate_and_load_pdf(file_path)
+    if reuse_document:
+        doc = load_cached_pdf_document(file_path, use_mmap=mmap_load)
+    else:
+        doc = validate_and_load_pdf(file_path, use_mmap=mmap_load)
+    qr_pool: Optional[ThreadPoolExecutor] = None
 
     try:
         # Step 2: Extract metadata
         metadata = extract_pdf_metadata(doc, file_path)
         logger.info(f"Extracted metadata: {metadata.title}")
 
-        # Step 3: Extract text content
+        # Step 3: Detect QR codes (if enabled)
+        # Page rendering stays on this thread (PyMuPDF is not thread-safe), but
+        # fetching QR URL content is network-bound and independent of the
+        # remaining stages, so it overlaps with text/image/table extraction.
+        # Worker processes are forked, which is unsafe while another thread
+        # runs, so with workers configured the content is fetched up front.
+        qr_codes: List[QRCodeReference] = []
+        qr_warnings: List[str] = []
+        qr_future: Optional[Future] = None
+        if detect_qr_codes_flag:
+            logger.info("Scanning for QR codes")
+            qr_codes, qr_warnings = scan_pdf_for_qr_codes(
+                doc, dpi=qr_dpi, max_pages=max_qr_scan_pages
+            )
+
+            if qr_codes:
+                logger.info(f"Found {len(qr_codes)} QR code(s), processing...")
+                if max(text_workers, image_workers, table_workers) > 1:
+                    qr_codes = process_qr_codes(
+                        qr_codes, fetch_urls=qr_fetch_urls, timeout=qr_timeout
+                    )
+                else:
+                    # Fetch content from QR code URLs in the background
+                    qr_pool = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="omniparser-qr"
+                    )
+                    qr_future = qr_pool.submit(
+                        process_qr_codes,
+                        qr_codes,
+                        fetch_urls=qr_fetch_urls,
+                        timeout=qr_timeout,
+                    )
+
+        # Step 4: Extract text content
         logger.info("Extracting text content")
+        # Blocks of the sampled pages, reused by text extraction
+        page_blocks: Dict[int, List[Dict]] = {}
+        scanned = is_scanned_pdf(doc, page_blocks=page_blocks)
+        file_hash = None
+        if scanned and use_ocr and ocr_cache_dir is not None:
+            # Key the per-page OCR cache by file contents
+            ocr_cache_dir = Path(ocr_cache_dir)
+            file_hash = compute_file_hash(file_path)
         content, text_blocks = extract_text_content(
             doc,
+            scanned=scanned,
+            ocr_cache_dir=ocr_cache_dir,
+            file_hash=file_hash,
             use_ocr=use_ocr,
             ocr_language=ocr_language,
             ocr_timeout=ocr_timeout,
+            ocr_colorspace=ocr_colorspace,
+            ocr_dpi=ocr_dpi,
             max_pages=max_pages,
+            file_path=file_path,
+            text_workers=text_workers,
+            ocr_workers=ocr_workers,
+            page_blocks=page_blocks,
         )
 
-        # Step 4: Process headings and detect chapters
+        # Step 5: Process headings and detect chapters
         logger.info("Processing headings and detecting chapters")
-        markdown_content, chapters = process_pdf_headings(text_blocks, content)
+        markdown_content, chapters = process_pdf_headings(
+            text_blocks, content, cache_chapters=cache_chapter_detection
+        )
+        # The span blocks (one dict per span) and the raw text are not needed
+        # past heading detection; release them before image/table extraction
+        del text_blocks, content
 
-        # Step 5: Clean text (if enabled)
+        # Step 6: Clean text (if enabled)
         if clean_text_flag:
             logger.info("Cleaning text")
             markdown_content = clean_text(markdown_content)
 
-        # Step 6: Extract images (if output_dir provided)
+        # Step 7: Extract images (if output_dir provided)
         images: List[ImageReference] = []
         if extract_images_flag and output_dir:
             logger.info(f"Extracting images to: {output_dir}")
-            images = extract_pdf_images(doc, output_dir=output_dir)
+            images = extract_pdf_images(
+                doc, output_dir=output_dir, file_path=file_path, workers=image_workers
+            )
 
-        # Step 7: Extract tables (if enabled)
+        # Step 8: Extract tables (if enabled)
         tables: List[str] = []
         if extract_tables_flag:
             logger.info("Extracting tables")
-            tables = extract_pdf_tables(doc)
+            tables = extract_pdf_tables(
+                doc,
+                is_scanned=scanned,
+                force_find_tables=force_find_tables,
+                file_path=file_path,
+                workers=table_workers,
+            )
             # Append tables to content
             if tables:
                 markdown_content += "\n\n## Extracted Tables\n\n"
                 markdown_content += "\n\n".join(tables)
 
-        # Step 8: Detect QR codes (if enabled)
-        qr_codes: List[QRCodeReference] = []
-        qr_warnings: List[str] = []
-        if detect_qr_codes_flag:
-            logger.info("Scanning for QR codes")
-            qr_codes, qr_warnings = scan_pdf_for_qr_codes(
-                doc, dpi=qr_dpi, max_pages=max_qr_scan_pages
-            )
+        # Step 9: Collect fetched QR code content
+        if qr_future is not None:
+            qr_codes = qr_future.result()
 
-            if qr_codes:
-                logger.info(f"Found {len(qr_codes)} QR code(s), processing...")
-                # Fetch content from QR code URLs
-                qr_codes = process_qr_codes(
-                    qr_codes,
-                    fetch_urls=qr_fetch_urls,
-                    timeout=qr_timeout,
-                )
-
-        # Step 9: Calculate word count and reading time
+        # Step 10: Calculate word count and reading time
         word_count = count_words(markdown_content)
         reading_time = estimate_reading_time(word_count)
 
-        # Step 10: Build ProcessingInfo
+        # Step 11: Build ProcessingInfo
         processing_time = time.time() - start_time
         all_warnings = qr_warnings.copy()  # Include QR warnings
         processing_info = ProcessingInfo(
@@ -180,7 +303,7 @@ def parse_pdf(
             options_used=options,
         )
 
-        # Step 11: Build Document
+        # Step 12: Build Document
         document = Document(
             document_id=file_path.stem,
             content=markdown_content,
@@ -192,7 +315,7 @@ def parse_pdf(
             estimated_reading_time=reading_time,
         )
 
-        # Step 12: Merge QR code content into document
+        # Step 13: Merge QR code content into document
         if qr_codes:
             document = merge_qr_content_to_document(
                 document,
@@ -201,6 +324,10 @@ def parse_pdf(
             )
             logger.info(f"Merged content from {len(qr_codes)} QR code(s)")
 
+        # Step 14: Cache result (if enabled)
+        if cache_key is not None:
+            store_cached_document(cache_dir, cache_key, document)
+
         logger.info(
             f"PDF parsing complete: {document.word_count} words, "
             f"{len(chapters)} chapters, {len(images)} images, "
@@ -210,5 +337,9 @@ def parse_pdf(
         return document
 
     finally:
-        # Always close the PDF document
-        doc.close()
+        # Don't block on outstanding QR fetches if parsing failed
+        if qr_pool is not None:
+            qr_pool.shutdown(wait=False, cancel_futures=True)
+        # Always close the PDF document, unless it is shared for reuse
+        if not reuse_document:
+            close_pdf_document(doc)
@@ -12,24 +12,55 @@ The module requires PyMuPDF >= 1.18.0 for table extraction support.
 """
 
 import logging
-from typing import List
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import fitz  # PyMuPDF
 
-from .utils import MIN_TABLE_ROWS
+from .utils import (
+    FIND_TABLES_PATHS_VERSION,
+    LAYOUT_ANALYZER_VERSION,
+    MIN_TABLE_ROWS,
+    PARALLEL_TABLE_MIN_PAGES,
+    quiet_mupdf_errors,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def extract_pdf_tables(doc: fitz.Document) -> List[str]:
+@quiet_mupdf_errors()
+def extract_pdf_tables(
+    doc: fitz.Document,
+    is_scanned: bool = False,
+    force_find_tables: bool = False,
+    file_path: Optional[Path] = None,
+    workers: int = 1,
+) -> List[str]:
     """
     Extract tables from PDF and convert to markdown format.
 
     Iterates through all pages in the PDF document, detects tables using
     PyMuPDF's find_tables() method, and converts them to markdown strings.
 
+    find_tables() runs a full layout analysis, so it is skipped where it
+    cannot find anything: for scanned (image-only) documents, and for pages
+    it has nothing to build cells from (see page_may_contain_tables()).
+
+    With workers > 1 and the document's file_path, pages are split into
+    contiguous ranges that worker processes search with their own copy of
+    the document, as for text and image extraction. Each worker gets at
+    least PARALLEL_TABLE_MIN_PAGES pages; shorter documents stay in-process.
+
     Args:
         doc: PyMuPDF document object.
+        is_scanned: Whether the document was classified as scanned; if so,
+            table extraction is skipped entirely.
+        force_find_tables: Run find_tables() on every page regardless of
+            the scanned classification and page content.
+        file_path: Path the document was opened from (needed for workers).
+        workers: Number of worker processes (default: 1 = in-process).
 
     Returns:
         List of markdown-formatted table strings with page numbers.
@@ -49,55 +80,182 @@ def extract_pdf_tables(doc: fitz.Document) -> List[str]:
         | Data1 | Data2 |
     """
     # Check PyMuPDF version for table extraction support
-    fitz_version = tuple(map(int, fitz.version[0].split(".")))
-    if fitz_version < (1, 18, 0):
+    if _pymupdf_version() < (1, 18, 0):
         logger.debug(
             f"PyMuPDF version {fitz.version[0]} does not support table extraction"
         )
         return []
 
-    tables = []
+    if is_scanned and not force_find_tables:
+        logger.debug("Skipping table extraction for scanned PDF")
+        return []
+
+    num_pages = len(doc)
+    workers = min(workers, num_pages // PARALLEL_TABLE_MIN_PAGES)
+    if workers > 1 and file_path is not None:
+        tables = _extract_tables_in_processes(
+            file_path, num_pages, workers, force_find_tables
+        )
+    else:
+        tables = []
+        for page_num in range(num_pages):
+            tables.extend(
+                _extract_page_tables(doc[page_num], page_num, force_find_tables)
+            )
 
-    for page_num in range(len(doc)):
-        page = doc[page_num]
+    logger.info(f"Extracted {len(tables)} tables")
+    return tables
 
-        try:
-            # Find tables on page
-            table_finder = page.find_tables()
 
-            if not table_finder or not table_finder.tables:
+def _extract_page_tables(
+    page: fitz.Page, page_num: int, force_find_tables: bool
+) -> List[str]:
+    """
+    Find the tables on one page as markdown strings with page headers.
+
+    Args:
+        page: PyMuPDF page object.
+        page_num: Page number (0-indexed).
+        force_find_tables: Skip the page_may_contain_tables() pre-check.
+
+    Returns:
+        Markdown tables found on the page (possibly empty).
+    """
+    tables = []
+    try:
+        # find_tables() reads the page's vector graphics itself; where it
+        # accepts them as paths, read them once and share them with the
+        # pre-check
+        drawings = None
+        find_kwargs: Dict[str, List[Dict]] = {}
+        if _pymupdf_version() >= FIND_TABLES_PATHS_VERSION:
+            drawings = page.get_drawings()
+            find_kwargs["paths"] = drawings
+        if not force_find_tables and not page_may_contain_tables(page, drawings):
+            logger.debug(f"No table candidates on page {page_num + 1}, skipping")
+            return tables
+
+        # Find tables on page
+        table_finder = page.find_tables(**find_kwargs)
+
+        if not table_finder or not table_finder.tables:
+            return tables
+
+        for table in table_finder.tables:
+            # Extract table data
+            table_data = table.extract()
+
+            if not table_data:
                 continue
 
-            for table in table_finder.tables:
-                # Extract table data
-                table_data = table.extract()
+            # Convert to markdown
+            markdown_table = table_to_markdown(table_data)
+            if markdown_table:
+                tables.append(f"**Table from page {page_num + 1}**\n\n{markdown_table}")
 
-                if not table_data:
-                    continue
+    except AttributeError as e:
+        # find_tables() not available in this PyMuPDF version
+        logger.debug(
+            f"Table extraction not supported or failed on page {page_num + 1}: {e}"
+        )
+    except Exception as e:
+        # Log exception type for debugging
+        logger.warning(
+            f"Table extraction failed on page {page_num + 1} "
+            f"({type(e).__name__}): {e}"
+        )
+    return tables
 
-                # Convert to markdown
-                markdown_table = table_to_markdown(table_data)
-                if markdown_table:
-                    tables.append(
-                        f"**Table from page {page_num + 1}**\n\n{markdown_table}"
-                    )
 
-        except AttributeError as e:
-            # find_tables() not available in this PyMuPDF version
-            logger.debug(
-                f"Table extraction not supported or failed on page {page_num + 1}: {e}"
-            )
-        except Exception as e:
-            # Log exception type for debugging
-            logger.warning(
-                f"Table extraction failed on page {page_num + 1} "
-                f"({type(e).__name__}): {e}"
+def _extract_table_range(
+    file_path: str, start: int, end: int, force_find_tables: bool
+) -> List[str]:
+    """Worker process entry point: find tables on pages [start, end)."""
+    tables = []
+    with fitz.open(file_path) as doc:
+        for page_num in range(start, end):
+            tables.extend(
+                _extract_page_tables(doc[page_num], page_num, force_find_tables)
             )
-
-    logger.info(f"Extracted {len(tables)} tables")
     return tables
 
 
+def _extract_tables_in_processes(
+    file_path: Path, num_pages: int, workers: int, force_find_tables: bool
+) -> List[str]:
+    """
+    Find tables with a process pool, one contiguous range per worker.
+
+    Args:
+        file_path: Path to PDF file (each worker opens its own copy).
+        num_pages: Number of pages in the document.
+        workers: Number of worker processes.
+        force_find_tables: Skip the page_may_contain_tables() pre-check.
+
+    Returns:
+        Markdown tables in page order.
+    """
+    pages_per_worker = -(-num_pages // workers)  # Ceiling division
+    starts = range(0, num_pages, pages_per_worker)
+    ends = [min(start + pages_per_worker, num_pages) for start in starts]
+
+    logger.info(f"Extracting tables from {num_pages} pages with {workers} processes")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        ranges = pool.map(
+            _extract_table_range,
+            [str(file_path)] * len(ends),
+            starts,
+            ends,
+            [force_find_tables] * len(ends),
+        )
+        return [table for range_tables in ranges for table in range_tables]
+
+
+def page_may_contain_tables(
+    page: fitz.Page, drawings: Optional[List[Dict]] = None
+) -> bool:
+    """
+    Cheap pre-check for whether find_tables() could find anything on a page.
+
+    find_tables() builds table cells from vector drawings (ruling lines and
+    boxes), so pages without drawings are skipped even when they have text,
+    as on most prose pages. Only when PyMuPDF uses a layout analyzer
+    (pymupdf_layout) can tables come from text alone, and then a text
+    layer is enough. Pure raster pages have neither.
+
+    Args:
+        page: PyMuPDF page object.
+        drawings: The page's get_drawings() paths, if already read.
+
+    Returns:
+        True if find_tables() may detect a table on the page.
+    """
+    if _layout_analyzer_available() and page.get_text("text", flags=0).strip():
+        return True
+    if drawings is None:
+        # get_cdrawings() skips building Point/Rect objects for every path
+        drawings = page.get_cdrawings()
+    return bool(drawings)
+
+
+def _pymupdf_version() -> Tuple[int, ...]:
+    """Return the installed PyMuPDF version as a tuple of integers."""
+    return tuple(map(int, fitz.version[0].split(".")))
+
+
+def _layout_analyzer_available() -> bool:
+    """
+    Check whether find_tables() uses the pymupdf_layout analyzer.
+
+    PyMuPDF >= LAYOUT_ANALYZER_VERSION hands pages to the analyzer once the
+    pymupdf.layout module (from the pymupdf_layout package) is imported.
+    """
+    return (
+        _pymupdf_version() >= LAYOUT_ANALYZER_VERSION
+        and "pymupdf.layout" in sys.modules
+    )
+
+
 def table_to_markdown(table_data: List[List]) -> str:
     """
     Convert table data to markdown format.
@@ -131,17 +289,24 @@ def table_to_markdown(table_data: List[List]) -> str:
         logger.debug(f"Discarding single-row table: {table_data[0]}")
         return ""
 
-    lines = []
+    lines = [_format_table_row(row) for row in table_data]
 
-    # Header row
-    header = table_data[0]
-    lines.append("| " + " | ".join(str(cell or "") for cell in header) + " |")
+    # Separator after the header row
+    lines.insert(1, "| " + " | ".join(["---"] * len(table_data[0])) + " |")
 
-    # Separator
-    lines.append("| " + " | ".join("---" for _ in header) + " |")
+    return "\n".join(lines)
 
-    # Data rows
-    for row in table_data[1:]:
-        lines.append("| " + " | ".join(str(cell or "") for cell in row) + " |")
 
-    return "\n".join(lines)
+def _format_table_row(row: List) -> str:
+    """
+    Format one table row as a markdown line.
+
+    Rows from Table.extract() are usually all strings, which str.join()
+    takes as-is; rows with None (merged cells) or non-string values make it
+    raise TypeError and are converted cell by cell instead.
+    """
+    try:
+        return "| " + " | ".join(row) + " |"
+    except TypeError:
+        cells = ["" if cell is None else str(cell) for cell in row]
+        return "| " + " | ".join(cells) + " |"
@@ -8,20 +8,43 @@ opened successfully before processing.
 Functions:
     validate_pdf_file: Validate PDF file existence and format
     load_pdf_document: Load PDF file with PyMuPDF
+    close_pdf_document: Close a PDF and release its memory mapping
     validate_and_load_pdf: Combined validation and loading operation
+    load_cached_pdf_document: Validate and load, reusing open documents
+    clear_pdf_cache: Drop documents kept by load_cached_pdf_document
 """
 
+import mmap
+import os
+import stat
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Tuple
 
 import fitz  # PyMuPDF
 
 from ...exceptions import FileReadError, ValidationError
+from .utils import (
+    DOCUMENT_CACHE_SIZE,
+    MMAP_MIN_FILE_SIZE,
+    PDF_HEADER,
+    PDF_HEADER_SEARCH_SIZE,
+    quiet_mupdf_errors,
+)
+
+# Open documents keyed by (absolute path, mtime_ns, size), least recent first
+_document_cache: "OrderedDict[Tuple[str, int, int], fitz.Document]" = OrderedDict()
+_document_cache_lock = threading.Lock()
 
 
 def validate_pdf_file(file_path: Path) -> None:
     """
     Validate PDF file exists and has correct extension.
 
+    Uses a single stat() call for both the existence and regular-file
+    checks; the extension check needs no system call.
+
     Args:
         file_path: Path to PDF file.
 
@@ -29,22 +52,43 @@ def validate_pdf_file(file_path: Path) -> None:
         ValidationError: If file validation fails (not found, not a file,
             or wrong extension).
     """
-    if not file_path.exists():
+    try:
+        file_stat = file_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         raise ValidationError(f"File not found: {file_path}")
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         raise ValidationError(f"Not a file: {file_path}")
 
-    if file_path.suffix.lower() != ".pdf":
+    # Cheaper than suffix.lower(), which re-parses the name; the length check
+    # keeps a bare ".pdf" name rejected, as it has no suffix
+    name = file_path.name
+    if len(name) <= 4 or not name.lower().endswith(".pdf"):
         raise ValidationError(f"Not a PDF file: {file_path}")
 
 
-def load_pdf_document(file_path: Path) -> fitz.Document:
+@quiet_mupdf_errors()
+def load_pdf_document(file_path: Path, use_mmap: bool = False) -> fitz.Document:
     """
     Load PDF file with PyMuPDF.
 
+    Files without a "%PDF-" marker in their first PDF_HEADER_SEARCH_SIZE
+    bytes are rejected with a single small read, before PyMuPDF attempts
+    to parse (and repair) them.
+
+    With use_mmap, files of at least MMAP_MIN_FILE_SIZE bytes are
+    memory-mapped and handed to PyMuPDF as a zero-copy buffer, so the kernel
+    pages in only the parts of the file MuPDF actually touches (e.g. when
+    max_pages limits work to the first few pages of a large scan). Only use
+    it for files nothing else will modify: truncating a mapped file makes
+    the next read fail with SIGBUS and kill the process. The mapping is
+    referenced by the returned document; close it with close_pdf_document()
+    to unmap the file immediately rather than when the document is garbage
+    collected.
+
     Args:
         file_path: Path to PDF file.
+        use_mmap: Memory-map large files instead of opening by path.
 
     Returns:
         PyMuPDF Document object.
@@ -54,13 +98,51 @@ def load_pdf_document(file_path: Path) -> fitz.Document:
             or invalid format).
     """
     try:
+        with open(file_path, "rb") as f:
+            # Reject non-PDFs before MuPDF starts parsing. The spec allows
+            # leading junk, so look for the marker like MuPDF does.
+            if PDF_HEADER not in f.read(PDF_HEADER_SEARCH_SIZE):
+                raise FileReadError(f"Not a PDF stream: {file_path}")
+
+            if use_mmap and os.fstat(f.fileno()).st_size >= MMAP_MIN_FILE_SIZE:
+                # The mapping keeps its own handle; the file can be closed
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                doc = fitz.open(stream=memoryview(mapped), filetype="pdf")
+                # Keep the mapping with the document so close_pdf_document()
+                # can unmap it
+                doc._omniparser_mmap = mapped
+                return doc
+
         doc = fitz.open(file_path)
         return doc
+    except FileReadError:
+        raise
     except Exception as e:
         raise FileReadError(f"Failed to open PDF: {e}")
 
 
-def validate_and_load_pdf(file_path: Path) -> fitz.Document:
+def close_pdf_document(doc: fitz.Document) -> None:
+    """
+    Close a PDF document and release its memory mapping, if any.
+
+    PyMuPDF keeps the input buffer alive after Document.close(), so a
+    memory-mapped file would otherwise stay mapped (and, on Windows,
+    locked) until the document object is garbage collected.
+
+    Args:
+        doc: Document returned by load_pdf_document().
+    """
+    doc.close()
+
+    mapped = getattr(doc, "_omniparser_mmap", None)
+    if isinstance(mapped, mmap.mmap):
+        stream = getattr(doc, "stream", None)
+        if isinstance(stream, memoryview):
+            stream.release()
+        mapped.close()
+
+
+def validate_and_load_pdf(file_path: Path, use_mmap: bool = False) -> fitz.Document:
     """
     Validate and load PDF file in a single operation.
 
@@ -69,6 +151,7 @@ def validate_and_load_pdf(file_path: Path) -> fitz.Document:
 
     Args:
         file_path: Path to PDF file.
+        use_mmap: Memory-map large files instead of opening by path.
 
     Returns:
         PyMuPDF Document object.
@@ -84,4 +167,75 @@ def validate_and_load_pdf(file_path: Path) -> fitz.Document:
         >>> doc.close()
     """
     validate_pdf_file(file_path)
-    return load_pdf_document(file_path)
+    return load_pdf_document(file_path, use_mmap=use_mmap)
+
+
+def load_cached_pdf_document(file_path: Path, use_mmap: bool = False) -> fitz.Document:
+    """
+    Validate and load a PDF file, reusing an already open document.
+
+    The last DOCUMENT_CACHE_SIZE documents are kept open, keyed by absolute
+    path, modification time and size, so re-opening an unchanged file skips
+    PyMuPDF's xref parsing. Editing the file changes the key and opens it
+    afresh.
+
+    The returned document is shared: callers must not close it or use it
+    from several threads at once. Evicted documents are closed with
+    close_pdf_document(), so callers must not keep using a document after
+    loading DOCUMENT_CACHE_SIZE others.
+
+    Args:
+        file_path: Path to PDF file.
+        use_mmap: Memory-map large files instead of opening by path.
+
+    Returns:
+        Shared PyMuPDF Document object.
+
+    Raises:
+        ValidationError: If file validation fails.
+        FileReadError: If PDF cannot be opened.
+
+    Example:
+        >>> doc = load_cached_pdf_document(Path("document.pdf"))
+        >>> doc is load_cached_pdf_document(Path("document.pdf"))
+        True
+    """
+    validate_pdf_file(file_path)
+    try:
+        file_stat = file_path.stat()
+    except OSError as e:
+        raise FileReadError(f"Failed to open PDF: {e}")
+    key = (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+
+    with _document_cache_lock:
+        doc = _document_cache.get(key)
+        if doc is not None and not doc.is_closed:
+            _document_cache.move_to_end(key)
+            return doc
+
+    doc = load_pdf_document(file_path, use_mmap=use_mmap)
+
+    evicted = []
+    with _document_cache_lock:
+        _document_cache[key] = doc
+        _document_cache.move_to_end(key)
+        while len(_document_cache) > DOCUMENT_CACHE_SIZE:
+            evicted.append(_document_cache.popitem(last=False)[1])
+
+    for old_doc in evicted:
+        if old_doc is not doc:
+            close_pdf_document(old_doc)
+
+    return doc
+
+
+def clear_pdf_cache() -> None:
+    """
+    Close and drop all documents kept by load_cached_pdf_document().
+    """
+    with _document_cache_lock:
+        docs = list(_document_cache.values())
+        _document_cache.clear()
+
+    for doc in docs:
+        close_pdf_document(doc)
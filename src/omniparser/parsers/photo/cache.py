@@ -0,0 +1,142 @@
+"""
+On-disk caching of extracted photo metadata.
+
+Reading metadata opens the image with PIL and walks its EXIF tags. Batch
+pipelines that re-read large, mostly unchanged photo libraries can keep
+the results in an opt-in sqlite database, keyed by the file's absolute
+path, modification time and size, so unchanged files skip PIL entirely.
+
+The cache is enabled by setting the OMNIPARSER_EXIF_CACHE environment
+variable to 1; entries are stored in DEFAULT_EXIF_CACHE_PATH.
+
+Functions:
+    exif_cache_enabled: Check whether the on-disk cache is enabled
+    load_cached_metadata: Load cached pickled metadata if present
+    store_cached_metadata: Write pickled metadata to the cache
+
+Note:
+    Metadata is stored with pickle. Only enable the cache for a home
+    directory you trust, since loading a pickle can execute arbitrary code.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EXIF_CACHE_ENV_VAR = "OMNIPARSER_EXIF_CACHE"
+DEFAULT_EXIF_CACHE_PATH = Path.home() / ".cache" / "omniparser" / "exif.sqlite3"
+# Bump whenever PhotoMetadata changes shape so stale entries are dropped
+CACHE_VERSION = 1
+SQLITE_TIMEOUT = 30  # Seconds to wait for another process's write lock
+
+# One connection per process and database, shared by threads under a lock;
+# the pid is recorded because connections must not cross fork()
+_connection: Optional[Tuple[int, Path, sqlite3.Connection]] = None
+_connection_lock = threading.Lock()
+
+
+def exif_cache_enabled() -> bool:
+    """
+    Check whether the on-disk metadata cache is enabled.
+
+    Returns:
+        True if OMNIPARSER_EXIF_CACHE is set to 1.
+    """
+    return os.environ.get(EXIF_CACHE_ENV_VAR) == "1"
+
+
+def load_cached_metadata(file_path: str, mtime_ns: int, size: int) -> Optional[bytes]:
+    """
+    Load cached pickled metadata for a file, if present and still current.
+
+    Args:
+        file_path: Absolute path of the image file.
+        mtime_ns: File modification time in nanoseconds (st_mtime_ns).
+        size: File size in bytes.
+
+    Returns:
+        Pickled PhotoMetadata, or None on a miss or if the cache is unusable.
+    """
+    with _connection_lock:
+        try:
+            row = (
+                _get_connection()
+                .execute(
+                    "SELECT blob FROM meta WHERE path = ? AND mtime = ? AND size = ?",
+                    (file_path, mtime_ns, size),
+                )
+                .fetchone()
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to read EXIF cache entry for {file_path}: {e}")
+            return None
+    return row[0] if row else None
+
+
+def store_cached_metadata(
+    file_path: str, mtime_ns: int, size: int, blob: bytes
+) -> None:
+    """
+    Write pickled metadata for a file to the cache, replacing older entries.
+
+    Failures are logged and otherwise ignored; caching is best-effort.
+
+    Args:
+        file_path: Absolute path of the image file.
+        mtime_ns: File modification time in nanoseconds (st_mtime_ns).
+        size: File size in bytes.
+        blob: Pickled PhotoMetadata.
+    """
+    with _connection_lock:
+        try:
+            _get_connection().execute(
+                "INSERT OR REPLACE INTO meta (path, mtime, size, blob) "
+                "VALUES (?, ?, ?, ?)",
+                (file_path, mtime_ns, size, blob),
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to write EXIF cache entry for {file_path}: {e}")
+
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Return this process's connection to the cache database, opening it if needed.
+
+    The database runs in autocommit mode with a write-ahead log, so readers
+    in other processes never wait on a writer. Must be called with
+    _connection_lock held.
+    """
+    global _connection
+
+    pid = os.getpid()
+    db_path = DEFAULT_EXIF_CACHE_PATH
+    if _connection is not None:
+        connection_pid, connection_path, conn = _connection
+        if connection_pid == pid and connection_path == db_path:
+            return conn
+        if connection_pid == pid:
+            conn.close()
+        _connection = None
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=SQLITE_TIMEOUT,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+        conn.execute("DROP TABLE IF EXISTS meta")
+        conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS meta "
+        "(path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, blob BLOB)"
+    )
+    _connection = (pid, db_path, conn)
+    return conn
@@ -5,19 +5,29 @@ This module provides comprehensive EXIF metadata extraction from image files,
 including camera information, GPS coordinates, timestamps, and more.
 
 Uses PIL/Pillow for EXIF parsing with fallback handling for missing data.
+Results are memoized per process and, when enabled, cached on disk (see
+the cache module), keyed by the file's path, modification time and size.
 """
 
 import logging
+import os
+import pickle
+import struct
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from PIL import Image
+from PIL import ExifTags, Image
 from PIL.ExifTags import GPSTAGS, TAGS
 
+from .cache import exif_cache_enabled, load_cached_metadata, store_cached_metadata
+
 logger = logging.getLogger(__name__)
 
+METADATA_CACHE_SIZE = 256  # Photos whose metadata is memoized per process
+
 
 @dataclass
 class GPSInfo:
@@ -211,6 +221,11 @@ class PhotoMetadata:
 def extract_photo_metadata(file_path: Union[Path, str]) -> PhotoMetadata:
     """Extract comprehensive metadata from a photo file.
 
+    Metadata is memoized by absolute path, modification time and size, so
+    reading the same unchanged file again (e.g. parse_photo() followed by
+    PhotoParser.extract_images()) skips PIL. With OMNIPARSER_EXIF_CACHE=1
+    it is also cached on disk across runs. Each call returns a new object.
+
     Args:
         file_path: Path to the image file.
 
@@ -225,15 +240,65 @@ def extract_photo_metadata(file_path: Union[Path, str]) -> PhotoMetadata:
     if not path.exists():
         raise FileNotFoundError(f"Image file not found: {file_path}")
 
+    file_stat = path.stat()
+    blob = _read_photo_metadata(
+        str(path.absolute()), file_stat.st_mtime_ns, file_stat.st_size
+    )
+    return pickle.loads(blob)
+
+
+def clear_metadata_cache() -> None:
+    """Clear the in-process metadata memo (the disk cache is left intact)."""
+    _read_photo_metadata.cache_clear()
+
+
+@lru_cache(maxsize=METADATA_CACHE_SIZE)
+def _read_photo_metadata(file_path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a photo's metadata as a pickle, from the disk cache if possible.
+
+    Memoized results are pickled bytes rather than PhotoMetadata objects,
+    so callers never share (and cannot mutate) a cached instance.
+
+    Args:
+        file_path: Absolute path of the image file.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        Pickled PhotoMetadata.
+    """
+    use_disk_cache = exif_cache_enabled()
+    if use_disk_cache:
+        blob = load_cached_metadata(file_path, mtime_ns, size)
+        if blob is not None:
+            return blob
+
+    metadata = _extract_photo_metadata(Path(file_path), size)
+    blob = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+    if use_disk_cache:
+        store_cached_metadata(file_path, mtime_ns, size, blob)
+    return blob
+
+
+def _extract_photo_metadata(path: Path, file_size: int) -> PhotoMetadata:
+    """Extract metadata from a photo file with PIL.
+
+    Args:
+        path: Absolute path to the image file.
+        file_size: File size in bytes.
+
+    Returns:
+        PhotoMetadata object with all extracted information.
+
+    Raises:
+        ValueError: If file is not a valid image.
+    """
     try:
         with Image.open(path) as img:
-            # Basic file info
-            file_stat = path.stat()
-
             metadata = PhotoMetadata(
-                file_path=str(path.absolute()),
+                file_path=str(path),
                 file_name=path.name,
-                file_size=file_stat.st_size,
+                file_size=file_size,
                 width=img.width,
                 height=img.height,
                 format=img.format or path.suffix.lstrip(".").upper(),
@@ -249,7 +314,7 @@ def extract_photo_metadata(file_path: Union[Path, str]) -> PhotoMetadata:
             return metadata
 
     except Exception as e:
-        logger.error(f"Failed to extract metadata from {file_path}: {e}")
+        logger.error(f"Failed to extract metadata from {path}: {e}")
         raise ValueError(f"Failed to read image file: {e}")
 
 
@@ -265,7 +330,7 @@ def _extract_exif_dict(img: Image.Image) -> Dict[str, Any]:
     exif_dict: Dict[str, Any] = {}
 
     try:
-        exif_raw = img._getexif()  # type: ignore[attr-defined]
+        exif_raw = _read_exif_tags(img)
         if not exif_raw:
             return exif_dict
 
@@ -294,6 +359,68 @@ def _extract_exif_dict(img: Image.Image) -> Dict[str, Any]:
     return exif_dict
 
 
+def _read_exif_tags(img: Image.Image) -> Dict[int, Any]:
+    """Read raw EXIF tags, with the Exif sub-IFD merged into the top level.
+
+    Uses Pillow's public Exif API, which unlike _getexif() also covers TIFF.
+    GPS tags are nested under the GPSInfo tag, as _getexif() returns them.
+
+    Args:
+        img: PIL Image object.
+
+    Returns:
+        Dictionary of EXIF tag IDs to values.
+    """
+    if img.format == "PNG" and not _png_may_have_exif(img):
+        return {}
+
+    exif = img.getexif()
+    tags: Dict[int, Any] = dict(exif)
+    tags.update(exif.get_ifd(ExifTags.IFD.Exif))
+    if ExifTags.IFD.GPSInfo in exif:
+        tags[ExifTags.IFD.GPSInfo] = exif.get_ifd(ExifTags.IFD.GPSInfo)
+    return tags
+
+
+def _png_may_have_exif(img: Image.Image) -> bool:
+    """Check whether a PNG could carry EXIF data, without decoding it.
+
+    Pillow only reads chunks that follow the image data (where an eXIf
+    chunk may legally be placed) by decoding the whole image, which is what
+    getexif() does for PNGs without EXIF in the header. Skipping from chunk
+    header to chunk header shows whether there is anything after the image
+    data at all.
+
+    Args:
+        img: PIL Image object opened from a PNG file.
+
+    Returns:
+        True if the PNG has header EXIF or chunks after the image data.
+    """
+    if "exif" in img.info or "Raw profile type exif" in img.info:
+        return True
+
+    fp = img.fp
+    position = fp.tell()
+    try:
+        fp.seek(8)  # PNG signature
+        seen_image_data = False
+        while True:
+            header = fp.read(8)
+            if len(header) < 8:
+                return False
+            length, chunk_type = struct.unpack(">I4s", header)
+            if chunk_type == b"IEND":
+                return False
+            if chunk_type == b"IDAT":
+                seen_image_data = True
+            elif seen_image_data:
+                return True
+            fp.seek(length + 4, os.SEEK_CUR)  # Chunk data and CRC
+    finally:
+        fp.seek(position)
+
+
 def _populate_metadata_from_exif(
     metadata: PhotoMetadata, exif: Dict[str, Any]
 ) -> None:
@@ -172,23 +172,22 @@ def validate_image_data(
         max_mb = max_size / 1024 / 1024
         return False, f"Image too large ({size_mb:.1f} MB, max {max_mb:.0f} MB)"
 
-    # Validate with PIL
+    # Validate with PIL, opening the image once: open() parses the header,
+    # so the size is known before verify() reads the rest of the data
     try:
-        # First pass: verify image integrity
-        with Image.open(io.BytesIO(image_data)) as img:
-            img.verify()
-
-        # Second pass: check dimensions (verify() closes the image)
         with Image.open(io.BytesIO(image_data)) as img:
             width, height = img.size
 
-            # Check minimum dimensions
+            # Check minimum dimensions (no need to verify rejected images)
             if width < min_size or height < min_size:
                 return (
                     False,
                     f"Image too small ({width}x{height}, min {min_size}x{min_size})",
                 )
 
+            # Verify image integrity
+            img.verify()
+
     except (IOError, OSError, Image.UnidentifiedImageError) as e:
         return False, f"Invalid image data: {e}"
 
@@ -19,7 +19,7 @@ Example:
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 import ftfy
 import yaml
@@ -45,6 +45,9 @@ def load_patterns() -> Dict[str, Any]:
         - description: Human-readable description
         - replacement: (transformation patterns only) Replacement string
 
+        A 'character_table' key holds the single-character replacements as
+        a str.translate table, applied before the transformation patterns.
+
     Raises:
         No exceptions raised - returns empty patterns on error.
 
@@ -66,7 +69,7 @@ def load_patterns() -> Dict[str, Any]:
             patterns = yaml.safe_load(f)
 
         # Compile regex patterns
-        compiled: Dict[str, List[Dict[str, Any]]] = {
+        compiled: Dict[str, Any] = {
             "removal_patterns": [],
             "transformation_patterns": [],
         }
@@ -99,6 +102,10 @@ def load_patterns() -> Dict[str, Any]:
                 }
             )
 
+        compiled["character_table"] = str.maketrans(
+            patterns.get("character_replacements") or {}
+        )
+
         _compiled_patterns = compiled
         logger.info(
             f"Loaded {len(compiled['removal_patterns'])} removal patterns, "
@@ -109,7 +116,11 @@ def load_patterns() -> Dict[str, Any]:
 
     except Exception as e:
         logger.warning(f"Failed to load cleaning patterns: {e}. Using empty patterns.")
-        _compiled_patterns = {"removal_patterns": [], "transformation_patterns": []}
+        _compiled_patterns = {
+            "removal_patterns": [],
+            "transformation_patterns": [],
+            "character_table": {},
+        }
         return _compiled_patterns
 
 
@@ -242,6 +253,9 @@ def _apply_transformation_patterns(text: str) -> str:
     """
     patterns = load_patterns()
 
+    # Single-character replacements in one pass
+    text = text.translate(patterns["character_table"])
+
     for pattern_dict in patterns["transformation_patterns"]:
         pattern = pattern_dict["pattern"]
         replacement = pattern_dict["replacement"]
@@ -0,0 +1,141 @@
+"""
+Unit tests for PDF document caching.
+
+Tests the cache functions in src/omniparser/parsers/pdf/cache.py including
+cache key computation, atomic writes, and cache hits in parse_pdf.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from omniparser.models import Document, Metadata
+from omniparser.parsers.pdf.cache import (
+    compute_cache_key,
+    compute_file_hash,
+    load_cached_document,
+    load_cached_ocr_page,
+    store_cached_document,
+    store_cached_ocr_page,
+)
+from omniparser.parsers.pdf.parser import parse_pdf
+
+
+@pytest.fixture
+def pdf_file(tmp_path: Path) -> Path:
+    """Create a small fake PDF file."""
+    path = tmp_path / "test.pdf"
+    path.write_bytes(b"%PDF-1.4 fake content")
+    return path
+
+
+@pytest.fixture
+def document() -> Document:
+    """Create a minimal Document."""
+    return Document(
+        document_id="test",
+        content="Cached content",
+        chapters=[],
+        images=[],
+        metadata=Metadata(title="Test", original_format="pdf"),
+        processing_info=None,
+        word_count=2,
+        estimated_reading_time=1,
+    )
+
+
+class TestComputeCacheKey:
+    """Test compute_cache_key function."""
+
+    def test_same_content_same_key(self, pdf_file: Path, tmp_path: Path) -> None:
+        """Test key depends on file contents, not path."""
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(pdf_file.read_bytes())
+        assert compute_cache_key(pdf_file) == compute_cache_key(copy)
+
+    def test_content_changes_key(self, pdf_file: Path) -> None:
+        """Test modified file produces a different key."""
+        key = compute_cache_key(pdf_file)
+        pdf_file.write_bytes(b"%PDF-1.4 other content")
+        assert compute_cache_key(pdf_file) != key
+
+    def test_options_change_key(self, pdf_file: Path) -> None:
+        """Test options that affect output produce different keys."""
+        assert compute_cache_key(pdf_file, {"use_ocr": True}) != compute_cache_key(
+            pdf_file, {"use_ocr": False}
+        )
+        assert compute_cache_key(pdf_file, output_dir=Path("a")) != (
+            compute_cache_key(pdf_file, output_dir=Path("b"))
+        )
+
+    def test_cache_dir_ignored(self, pdf_file: Path) -> None:
+        """Test cache_dir option does not affect the key."""
+        assert compute_cache_key(pdf_file, {"cache_dir": "/a"}) == compute_cache_key(
+            pdf_file, {"cache_dir": "/b"}
+        )
+
+
+class TestCacheStorage:
+    """Test load_cached_document and store_cached_document functions."""
+
+    def test_round_trip(self, tmp_path: Path, document: Document) -> None:
+        """Test stored document can be loaded back."""
+        cache_dir = tmp_path / "cache"
+        store_cached_document(cache_dir, "abc", document)
+
+        loaded = load_cached_document(cache_dir, "abc")
+
+        assert loaded is not None
+        assert loaded.content == "Cached content"
+        assert not list(cache_dir.glob("*.tmp"))
+
+    def test_miss(self, tmp_path: Path) -> None:
+        """Test missing entry returns None."""
+        assert load_cached_document(tmp_path, "missing") is None
+
+    def test_corrupt_entry(self, tmp_path: Path) -> None:
+        """Test corrupt entry is treated as a miss."""
+        (tmp_path / "bad.pkl").write_bytes(b"not a pickle")
+        assert load_cached_document(tmp_path, "bad") is None
+
+
+class TestOcrPageCache:
+    """Test per-page OCR cache functions."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test stored page text can be loaded back."""
+        store_cached_ocr_page(tmp_path, "abc", 4, 300, "eng", "gray", "Text ü")
+        assert load_cached_ocr_page(tmp_path, "abc", 4, 300, "eng", "gray") == (
+            "Text ü"
+        )
+
+    def test_key_includes_render_settings(self, tmp_path: Path) -> None:
+        """Test entries are not shared across pages, DPI or language."""
+        store_cached_ocr_page(tmp_path, "abc", 0, 300, "eng", "gray", "Text")
+        assert load_cached_ocr_page(tmp_path, "abc", 1, 300, "eng", "gray") is None
+        assert load_cached_ocr_page(tmp_path, "abc", 0, 200, "eng", "gray") is None
+        assert load_cached_ocr_page(tmp_path, "abc", 0, 300, "deu", "gray") is None
+        assert load_cached_ocr_page(tmp_path, "xyz", 0, 300, "eng", "gray") is None
+
+    def test_file_hash(self, pdf_file: Path) -> None:
+        """Test file hash is stable for unchanged contents."""
+        assert compute_file_hash(pdf_file) == compute_file_hash(pdf_file)
+
+
+class TestParsePdfCache:
+    """Test cache integration in parse_pdf."""
+
+    @patch("omniparser.parsers.pdf.parser.validate_and_load_pdf")
+    def test_cache_hit_skips_parsing(
+        self, mock_validate, pdf_file: Path, tmp_path: Path, document: Document
+    ) -> None:
+        """Test cached Document is returned without opening the PDF."""
+        cache_dir = tmp_path / "cache"
+        options = {"cache_dir": cache_dir}
+        store_cached_document(cache_dir, compute_cache_key(pdf_file, options), document)
+
+        result = parse_pdf(pdf_file, options=options)
+
+        assert result.content == "Cached content"
+        mock_validate.assert_not_called()
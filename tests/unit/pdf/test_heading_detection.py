@@ -5,15 +5,24 @@ Tests the heading detection, font-to-level mapping, markdown conversion,
 and chapter detection functionality.
 """
 
+import statistics
+from collections import Counter
+from unittest.mock import patch
+
 import pytest
 
 from omniparser.parsers.pdf.heading_detection import (
+    build_font_size_level_map,
+    clear_chapter_cache,
     convert_headings_to_markdown,
     detect_chapters_from_content,
     detect_headings_from_fonts,
+    font_size_statistics,
     map_font_size_to_level,
     process_pdf_headings,
+    select_heading_indices,
 )
+from omniparser.parsers.pdf.text_extraction import TextBlock
 
 
 class TestDetectHeadingsFromFonts:
@@ -59,13 +68,7 @@ class TestDetectHeadingsFromFonts:
         assert headings == []
 
     def test_detect_headings_from_fonts_no_headings(self) -> None:
-        """Test heading detection with uniform font sizes.
-
-        Note: When all text blocks have the same font size and std_dev=0,
-        the threshold equals the average, so all text may be detected as headings.
-        This is expected behavior - in practice, PDFs with structure will have
-        varying font sizes.
-        """
+        """Test uniform font sizes without bold text yield no headings."""
         text_blocks = [
             {
                 "text": "Regular text 1",
@@ -89,9 +92,7 @@ class TestDetectHeadingsFromFonts:
 
         headings = detect_headings_from_fonts(text_blocks)
 
-        # With uniform font sizes (std_dev=0), threshold = avg, all match
-        # This is expected behavior - real PDFs have varying fonts
-        assert len(headings) == 3
+        assert headings == []
 
     def test_detect_headings_from_fonts_custom_max_words(self) -> None:
         """Test heading detection with custom max words limit."""
@@ -117,6 +118,101 @@ class TestDetectHeadingsFromFonts:
         assert len(headings) == 1
         assert headings[0][0] == "Short Heading"
 
+    def test_detect_headings_from_fonts_max_words_boundary(self) -> None:
+        """Test headings of exactly max_heading_words words are kept."""
+        text_blocks = [
+            {
+                "text": "One two three",
+                "font_size": 18.0,
+                "is_bold": True,
+                "position": 0,
+            },
+            {
+                "text": "One two three four",
+                "font_size": 18.0,
+                "is_bold": True,
+                "position": 20,
+            },
+            {"text": "Body text", "font_size": 12.0, "is_bold": False, "position": 40},
+        ]
+
+        headings = detect_headings_from_fonts(text_blocks, max_heading_words=3)
+
+        assert [heading[0] for heading in headings] == ["One two three"]
+
+    def test_detect_headings_from_fonts_text_blocks_match_dicts(self) -> None:
+        """Test TextBlocks and equivalent dicts give the same headings."""
+        text_blocks = [
+            TextBlock("Chapter One", 18.0, True, 1, 0),
+            TextBlock("Regular text", 12.0, False, 1, 12),
+            TextBlock("More regular text", 12.0, False, 2, 25),
+        ]
+        dict_blocks = [
+            {
+                "text": block.text,
+                "font_size": block.font_size,
+                "is_bold": block.is_bold,
+                "position": block.position,
+            }
+            for block in text_blocks
+        ]
+
+        headings = detect_headings_from_fonts(text_blocks)
+
+        assert headings == [("Chapter One", 1, 0)]
+        assert detect_headings_from_fonts(dict_blocks) == headings
+
+    def test_detect_headings_from_fonts_matches_exact_statistics(self) -> None:
+        """Test float statistics select the same headings as exact ones."""
+        sizes = [9.0, 10.0, 10.5, 11.96, 12.0, 14.0, 18.0, 24.0] * 50 + [30.0]
+        text_blocks = [
+            {"text": f"Word{i}", "font_size": size, "is_bold": False, "position": i}
+            for i, size in enumerate(sizes)
+        ]
+        threshold = statistics.mean(sizes) + 1.5 * statistics.stdev(sizes)
+
+        headings = detect_headings_from_fonts(text_blocks)
+
+        expected = [i for i, size in enumerate(sizes) if size >= threshold]
+        assert [position for _, _, position in headings] == expected
+
+
+class TestFontSizeStatistics:
+    """Test font size statistics computed from a size histogram."""
+
+    def test_matches_statistics_module(self) -> None:
+        """Test the histogram gives the same mean and stdev as the full list."""
+        sizes = [9.0, 10.0, 10.0, 10.5, 12.0, 12.0, 14.0, 18.0, 24.0]
+        avg_size, std_dev = font_size_statistics(Counter(sizes))
+        assert avg_size == pytest.approx(statistics.mean(sizes))
+        assert std_dev == pytest.approx(statistics.stdev(sizes))
+
+    def test_single_block_has_no_deviation(self) -> None:
+        """Test a single block has zero standard deviation."""
+        assert font_size_statistics(Counter([12.0])) == (12.0, 0.0)
+
+
+class TestSelectHeadingIndices:
+    """Test heading candidate selection from font columns."""
+
+    def test_select_by_size_threshold(self) -> None:
+        """Test blocks at or above the threshold are selected."""
+        assert select_heading_indices([18.0, 12.0, 16.0], [False] * 3, 16.0, 14.0) == [
+            0,
+            2,
+        ]
+
+    def test_select_bold_above_average(self) -> None:
+        """Test bold blocks qualify only when above average size."""
+        indices = select_heading_indices(
+            [13.0, 11.0, 12.0], [True, True, False], 20.0, 12.0
+        )
+        assert indices == [0]
+
+    def test_select_empty(self) -> None:
+        """Test empty columns select nothing."""
+        assert select_heading_indices([], [], 12.0, 12.0) == []
+
 
 class TestMapFontSizeToLevel:
     """Test font size to heading level mapping."""
@@ -146,6 +242,17 @@ class TestMapFontSizeToLevel:
         level_unknown = map_font_size_to_level(99.0, unique_sizes)
         assert level_unknown == 3  # Default
 
+    def test_build_font_size_level_map_matches_mapping(self) -> None:
+        """Test the precomputed map agrees with per-size mapping."""
+        unique_sizes = [24.0, 22.0, 20.0, 18.0, 16.0, 14.0, 12.0]
+
+        level_map = build_font_size_level_map(unique_sizes)
+
+        assert level_map == {
+            size: map_font_size_to_level(size, unique_sizes) for size in unique_sizes
+        }
+        assert level_map[12.0] == 6
+
 
 class TestConvertHeadingsToMarkdown:
     """Test heading to markdown conversion."""
@@ -212,6 +319,33 @@ class TestConvertHeadingsToMarkdown:
         assert "# Chapter One" in result
         assert "## Chapter One Point One" in result
 
+    def test_convert_headings_to_markdown_prefers_recorded_position(self) -> None:
+        """Test the occurrence at the recorded position is converted."""
+        text = "Summary of the Summary section. Summary\nBody text."
+        headings = [("Summary", 1, 32)]
+
+        result = convert_headings_to_markdown(text, headings)
+
+        assert result == "Summary of the Summary section. \n# Summary\n\nBody text."
+
+    def test_convert_headings_to_markdown_drifted_position(self) -> None:
+        """Test headings a few characters from their position still match."""
+        text = "Intro text.  Methods\nBody text."
+        headings = [("Methods", 2, 11)]
+
+        result = convert_headings_to_markdown(text, headings)
+
+        assert result == "Intro text.  \n## Methods\n\nBody text."
+
+    def test_convert_headings_to_markdown_window_search(self) -> None:
+        """Test headings far from their position are found in the window."""
+        text = "x" * 50 + " Results\nBody text."
+        headings = [("Results", 1, 0)]
+
+        result = convert_headings_to_markdown(text, headings)
+
+        assert result == "x" * 50 + " \n# Results\n\nBody text."
+
 
 class TestDetectChaptersFromContent:
     """Test chapter detection from markdown."""
@@ -255,6 +389,25 @@ class TestDetectChaptersFromContent:
         assert "Level 1" not in chapter_titles  # Too low
         assert "Level 4" not in chapter_titles  # Too high
 
+    @patch("omniparser.parsers.pdf.heading_detection.detect_chapters")
+    def test_detect_chapters_from_content_cached(self, mock_detect) -> None:
+        """Test cached detection reuses results but returns fresh copies."""
+        from omniparser.processors.chapter_detector import detect_chapters
+
+        mock_detect.side_effect = detect_chapters
+        content = "# Chapter 1\n\nText.\n\n# Chapter 2\n\nMore text."
+        clear_chapter_cache()
+
+        first = detect_chapters_from_content(content, use_cache=True)
+        first[0].title = "Changed"
+        second = detect_chapters_from_content(content, use_cache=True)
+
+        assert mock_detect.call_count == 1
+        assert [c.title for c in second] == ["Chapter 1", "Chapter 2"]
+        detect_chapters_from_content(content, max_level=2, use_cache=True)
+        assert mock_detect.call_count == 2
+        clear_chapter_cache()
+
 
 class TestProcessPdfHeadings:
     """Test the main heading processing coordinator."""
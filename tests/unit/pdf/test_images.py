@@ -10,11 +10,18 @@ import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import fitz
 import pytest
 from PIL import Image
 
 from omniparser.models import ImageReference
-from omniparser.parsers.pdf.images import extract_page_images, extract_pdf_images
+from omniparser.parsers.pdf.images import (
+    _extract_image_range,
+    extract_page_images,
+    extract_pdf_images,
+)
+
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures" / "pdf"
 
 
 class TestExtractPDFImages:
@@ -132,8 +139,9 @@ class TestExtractPDFImages:
 
         images = extract_pdf_images(mock_doc)
 
-        # Small image should be filtered out
+        # Small image should be filtered out before its data is extracted
         assert len(images) == 0
+        mock_doc.extract_image.assert_not_called()
 
     def test_extract_pdf_images_max_images_limit(self) -> None:
         """Test that max_images parameter limits extraction."""
@@ -166,6 +174,18 @@ class TestExtractPDFImages:
         # Should only extract 1 image despite 2 being available
         assert len(images) == 1
 
+    @patch("omniparser.parsers.pdf.images.tempfile.TemporaryDirectory")
+    def test_extract_pdf_images_max_images_zero(self, mock_temp_dir) -> None:
+        """Test max_images=0 returns before creating a directory or reading pages."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 2
+
+        images = extract_pdf_images(mock_doc, max_images=0)
+
+        assert images == []
+        mock_temp_dir.assert_not_called()
+        mock_doc.__getitem__.assert_not_called()
+
     def test_extract_pdf_images_multiple_pages(self) -> None:
         """Test extraction across multiple pages."""
         # Create valid image data
@@ -204,6 +224,120 @@ class TestExtractPDFImages:
             assert images[0].image_id == "img_0001"
             assert images[1].image_id == "img_0002"
 
+    def test_extract_pdf_images_repeated_xref_saved_once(self) -> None:
+        """Test an image shown on several pages is extracted and saved once."""
+        img_bytes = io.BytesIO()
+        Image.new("RGB", (800, 600)).save(img_bytes, format="PNG")
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 2
+        mock_page = MagicMock()
+        mock_page.get_images.return_value = [
+            (7, 0, 800, 600, 8, "DeviceRGB", "", "Im1", "FlateDecode")
+        ]
+        mock_doc.__getitem__.return_value = mock_page
+        mock_doc.extract_image.return_value = {
+            "image": img_bytes.getvalue(),
+            "ext": "png",
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            images = extract_pdf_images(mock_doc, Path(tmpdir))
+
+            mock_doc.extract_image.assert_called_once_with(7)
+            assert len(list(Path(tmpdir).iterdir())) == 1
+            assert [img.image_id for img in images] == ["img_0001", "img_0002"]
+            assert images[0].file_path == images[1].file_path
+            assert images[1].alt_text == "Image on page 2"
+            assert images[1].position == 1000
+
+    def test_extract_pdf_images_identical_content_saved_once(self) -> None:
+        """Test identical images stored under different xrefs share one file."""
+        img_bytes = io.BytesIO()
+        Image.new("RGB", (800, 600)).save(img_bytes, format="PNG")
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+        mock_doc.__getitem__.return_value.get_images.return_value = [
+            (7, 0, 800, 600, 8, "DeviceRGB", "", "Im1", "FlateDecode"),
+            (8, 0, 800, 600, 8, "DeviceRGB", "", "Im2", "FlateDecode"),
+        ]
+        mock_doc.extract_image.return_value = {
+            "image": img_bytes.getvalue(),
+            "ext": "png",
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            images = extract_pdf_images(mock_doc, Path(tmpdir))
+
+            assert mock_doc.extract_image.call_count == 2
+            assert len(list(Path(tmpdir).iterdir())) == 1
+            assert [img.image_id for img in images] == ["img_0001", "img_0002"]
+            assert images[0].file_path == images[1].file_path
+            assert images[1].position == 1
+
+    @patch("omniparser.parsers.pdf.images.PARALLEL_IMAGE_MIN_PAGES", 2)
+    @patch("omniparser.parsers.pdf.images.PARALLEL_IMAGE_RANGE_PAGES", 1)
+    def test_extract_pdf_images_workers_match_sequential(self, tmp_path) -> None:
+        """Test worker processes produce the same images as in-process."""
+        file_path = FIXTURES_DIR / "SimplebreadPDF.pdf"
+        with fitz.open(file_path) as doc:
+            sequential = extract_pdf_images(doc, tmp_path / "seq")
+            parallel = extract_pdf_images(
+                doc, tmp_path / "par", file_path=file_path, workers=3
+            )
+
+        assert len(parallel) == len(sequential) > 1
+        for seq_ref, par_ref in zip(sequential, parallel):
+            assert par_ref.image_id == seq_ref.image_id
+            assert par_ref.position == seq_ref.position
+            assert par_ref.size == seq_ref.size
+            assert (
+                Path(par_ref.file_path).read_bytes()
+                == Path(seq_ref.file_path).read_bytes()
+            )
+
+    @patch("omniparser.parsers.pdf.images.PARALLEL_IMAGE_MIN_PAGES", 2)
+    @patch("omniparser.parsers.pdf.images.PARALLEL_IMAGE_RANGE_PAGES", 1)
+    def test_extract_pdf_images_workers_max_images(self, tmp_path) -> None:
+        """Test max_images is enforced when extracting with workers."""
+        file_path = FIXTURES_DIR / "SimplebreadPDF.pdf"
+        with fitz.open(file_path) as doc:
+            images = extract_pdf_images(
+                doc, tmp_path, max_images=2, file_path=file_path, workers=3
+            )
+
+        assert [image.image_id for image in images] == ["img_0001", "img_0002"]
+
+    def test_extract_image_range_skips_known_xrefs(self) -> None:
+        """Test worker ranges don't decode images the caller already saved."""
+        file_path = FIXTURES_DIR / "SimplebreadPDF.pdf"
+        pages = _extract_image_range(str(file_path), 0, 6)
+        xrefs = [xref for page in pages for _, xref, extracted in page if extracted]
+        assert xrefs
+
+        pages = _extract_image_range(str(file_path), 0, 6, frozenset(xrefs[:1]))
+
+        skipped = [
+            extracted
+            for page in pages
+            for _, xref, extracted in page
+            if xref == xrefs[0]
+        ]
+        assert skipped and all(extracted is None for extracted in skipped)
+
+    @patch("omniparser.parsers.pdf.images.ProcessPoolExecutor")
+    def test_extract_pdf_images_small_doc_in_process(self, mock_pool) -> None:
+        """Test documents too short to split never start a process pool."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_doc.__getitem__.return_value.get_images.return_value = []
+
+        images = extract_pdf_images(mock_doc, file_path=Path("doc.pdf"), workers=4)
+
+        assert images == []
+        mock_pool.assert_not_called()
+
 
 class TestExtractPageImages:
     """Test extract_page_images function."""
@@ -240,6 +374,31 @@ class TestExtractPageImages:
             assert images[0].image_id == "img_0001"
             assert images[0].position == 0  # page_num * 1000 + img_index
 
+    @patch("omniparser.parsers.pdf.images.get_image_dimensions")
+    def test_extract_page_images_uses_reported_size(self, mock_dimensions) -> None:
+        """Test the size reported by extract_image() skips re-reading the image."""
+        img_bytes = io.BytesIO()
+        Image.new("RGB", (800, 600)).save(img_bytes, format="PNG")
+
+        mock_page = MagicMock()
+        mock_page.get_images.return_value = [
+            (1, 0, 800, 600, 8, "DeviceRGB", "", "Im1", "FlateDecode")
+        ]
+        mock_doc = MagicMock()
+        mock_doc.extract_image.return_value = {
+            "image": img_bytes.getvalue(),
+            "ext": "png",
+            "width": 800,
+            "height": 600,
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            images, _ = extract_page_images(mock_page, 0, Path(tmpdir), 0, mock_doc)
+
+        mock_dimensions.assert_not_called()
+        assert images[0].size == (800, 600)
+        assert images[0].format == "png"
+
     def test_extract_page_images_invalid_image(self) -> None:
         """Test that invalid images are skipped."""
         # Mock page with image
@@ -298,6 +457,26 @@ class TestExtractPageImages:
             assert len(images) == 0
             mock_logger.warning.assert_called()
 
+    def test_extract_page_images_failed_xref_not_retried(self) -> None:
+        """Test an image that fails to extract is not retried on later pages."""
+        mock_page = MagicMock()
+        mock_page.get_images.return_value = [
+            (1, 0, 800, 600, 8, "DeviceRGB", "", "Im1", "DCTDecode")
+        ]
+        mock_doc = MagicMock()
+        mock_doc.extract_image.side_effect = RuntimeError("corrupt stream")
+        seen_images = {}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for page_num in range(3):
+                images, counter = extract_page_images(
+                    mock_page, page_num, Path(tmpdir), 0, mock_doc, None, seen_images
+                )
+                assert images == []
+                assert counter == 0
+
+        mock_doc.extract_image.assert_called_once_with(1)
+
     def test_extract_page_images_increments_counter(self) -> None:
         """Test that counter is properly incremented."""
         # Create valid image data
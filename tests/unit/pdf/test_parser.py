@@ -141,7 +141,7 @@ class TestParsePdfBasic:
         assert len(doc.images) == 0
 
         # Verify mocks called
-        mock_validate.assert_called_once_with(pdf_path)
+        mock_validate.assert_called_once_with(pdf_path, use_mmap=False)
         mock_text.assert_called_once()
         mock_headings.assert_called_once()
         mock_pdf_document.close.assert_called_once()
@@ -234,6 +234,7 @@ class TestParsePdfOptions:
         assert call_kwargs["ocr_language"] == "fra"
         assert call_kwargs["ocr_timeout"] == 600
         assert call_kwargs["max_pages"] == 5
+        assert call_kwargs["ocr_cache_dir"] is None
 
     @patch("omniparser.parsers.pdf.parser.validate_and_load_pdf")
     @patch("omniparser.parsers.pdf.parser.extract_pdf_metadata")
@@ -312,6 +313,116 @@ class TestParsePdfTables:
         mock_tables.assert_called_once()
 
 
+class TestParsePdfQRCodes:
+    """Test QR code detection in PDF parsing."""
+
+    @patch("omniparser.parsers.pdf.parser.validate_and_load_pdf")
+    @patch("omniparser.parsers.pdf.parser.extract_pdf_metadata")
+    @patch("omniparser.parsers.pdf.parser.scan_pdf_for_qr_codes")
+    @patch("omniparser.parsers.pdf.parser.process_qr_codes")
+    @patch("omniparser.parsers.pdf.parser.merge_qr_content_to_document")
+    @patch("omniparser.parsers.pdf.parser.extract_text_content")
+    @patch("omniparser.parsers.pdf.parser.process_pdf_headings")
+    @patch("omniparser.parsers.pdf.parser.extract_pdf_tables")
+    @patch("omniparser.parsers.pdf.parser.clean_text")
+    def test_parse_pdf_fetches_qr_content_in_background(
+        self,
+        mock_clean,
+        mock_tables,
+        mock_headings,
+        mock_text,
+        mock_merge,
+        mock_process_qr,
+        mock_scan_qr,
+        mock_metadata,
+        mock_validate,
+        mock_pdf_document,
+        tmp_path,
+    ):
+        """Test QR URL fetching runs off the main thread and is merged."""
+        import threading
+
+        mock_validate.return_value = mock_pdf_document
+        mock_metadata.return_value = Metadata(title="Test", original_format="pdf")
+        mock_text.return_value = ("Content", [])
+        mock_headings.return_value = ("Content", [])
+        mock_tables.return_value = []
+        mock_clean.side_effect = lambda text: text
+
+        detected = [MagicMock(name="qr")]
+        fetched = [MagicMock(name="qr_fetched")]
+        mock_scan_qr.return_value = (detected, ["qr warning"])
+        fetch_threads = []
+
+        def fake_process(qr_codes, **kwargs):
+            fetch_threads.append(threading.current_thread())
+            return fetched
+
+        mock_process_qr.side_effect = fake_process
+        mock_merge.side_effect = lambda document, qr_codes, **kwargs: document
+
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.touch()
+        doc = parse_pdf(pdf_path, options={"detect_qr_codes": True})
+
+        assert fetch_threads[0] is not threading.main_thread()
+        mock_process_qr.assert_called_once_with(detected, fetch_urls=True, timeout=15)
+        assert mock_merge.call_args[0][1] == fetched
+        assert "qr warning" in doc.processing_info.warnings
+
+    @patch("omniparser.parsers.pdf.parser.validate_and_load_pdf")
+    @patch("omniparser.parsers.pdf.parser.extract_pdf_metadata")
+    @patch("omniparser.parsers.pdf.parser.scan_pdf_for_qr_codes")
+    @patch("omniparser.parsers.pdf.parser.process_qr_codes")
+    @patch("omniparser.parsers.pdf.parser.merge_qr_content_to_document")
+    @patch("omniparser.parsers.pdf.parser.extract_text_content")
+    @patch("omniparser.parsers.pdf.parser.process_pdf_headings")
+    @patch("omniparser.parsers.pdf.parser.extract_pdf_tables")
+    @patch("omniparser.parsers.pdf.parser.clean_text")
+    def test_parse_pdf_fetches_qr_content_before_worker_processes(
+        self,
+        mock_clean,
+        mock_tables,
+        mock_headings,
+        mock_text,
+        mock_merge,
+        mock_process_qr,
+        mock_scan_qr,
+        mock_metadata,
+        mock_validate,
+        mock_pdf_document,
+        tmp_path,
+    ):
+        """Test no fetch thread is running when worker processes may fork."""
+        import threading
+
+        mock_validate.return_value = mock_pdf_document
+        mock_metadata.return_value = Metadata(title="Test", original_format="pdf")
+        mock_text.return_value = ("Content", [])
+        mock_headings.return_value = ("Content", [])
+        mock_tables.return_value = []
+        mock_clean.side_effect = lambda text: text
+
+        detected = [MagicMock(name="qr")]
+        fetched = [MagicMock(name="qr_fetched")]
+        mock_scan_qr.return_value = (detected, [])
+        fetch_threads = []
+
+        def fake_process(qr_codes, **kwargs):
+            fetch_threads.append(threading.current_thread())
+            return fetched
+
+        mock_process_qr.side_effect = fake_process
+        mock_merge.side_effect = lambda document, qr_codes, **kwargs: document
+
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.touch()
+        parse_pdf(pdf_path, options={"detect_qr_codes": True, "text_workers": 2})
+
+        assert fetch_threads == [threading.main_thread()]
+        assert mock_merge.call_args[0][1] == fetched
+
+
 class TestParsePdfErrors:
     """Test PDF parsing error handling."""
 
@@ -355,6 +466,26 @@ class TestParsePdfErrors:
         # Verify PDF was closed
         mock_pdf_document.close.assert_called_once()
 
+    @patch("omniparser.parsers.pdf.parser.load_cached_pdf_document")
+    @patch("omniparser.parsers.pdf.parser.validate_and_load_pdf")
+    @patch("omniparser.parsers.pdf.parser.extract_pdf_metadata")
+    def test_parse_pdf_reuse_document_not_closed(
+        self, mock_metadata, mock_validate, mock_cached, mock_pdf_document, tmp_path
+    ):
+        """Test a shared document is loaded from the cache and left open."""
+        mock_cached.return_value = mock_pdf_document
+        mock_metadata.side_effect = Exception("Metadata error")
+
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.touch()
+
+        with pytest.raises(Exception, match="Metadata error"):
+            parse_pdf(pdf_path, options={"reuse_document": True})
+
+        mock_cached.assert_called_once_with(pdf_path, use_mmap=False)
+        mock_validate.assert_not_called()
+        mock_pdf_document.close.assert_not_called()
+
 
 class TestParsePdfProcessingInfo:
     """Test ProcessingInfo generation."""
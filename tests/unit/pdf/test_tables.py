@@ -7,11 +7,20 @@ Tests the table extraction and markdown conversion functions including:
 - Edge cases and error handling
 """
 
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import fitz
 import pytest
 
-from omniparser.parsers.pdf.tables import extract_pdf_tables, table_to_markdown
+from omniparser.parsers.pdf.tables import (
+    extract_pdf_tables,
+    page_may_contain_tables,
+    table_to_markdown,
+)
+
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures" / "pdf"
 
 
 class TestTableToMarkdown:
@@ -99,6 +108,17 @@ class TestTableToMarkdown:
         assert "| Widget | 19.99 | 100 |" in result
         assert "| Gadget | 29.99 | 50 |" in result
 
+    def test_table_to_markdown_zero_values_kept(self) -> None:
+        """Test falsy values other than None are rendered, not blanked."""
+        table_data = [
+            ["Item", "Count", "Balance", "Active"],
+            ["Widget", 0, 0.0, False],
+        ]
+
+        result = table_to_markdown(table_data)
+
+        assert "| Widget | 0 | 0.0 | False |" in result
+
     def test_table_to_markdown_empty_cells(self) -> None:
         """Test table with empty string cells."""
         table_data = [
@@ -321,3 +341,164 @@ class TestExtractPdfTables:
 
         # Should handle error and return empty list
         assert result == []
+
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_extract_pdf_tables_skips_scanned(self, mock_fitz) -> None:
+        """Test scanned documents skip table detection entirely."""
+        mock_fitz.version = ["1.18.0"]
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+
+        result = extract_pdf_tables(mock_doc, is_scanned=True)
+
+        assert result == []
+        mock_doc.__getitem__.assert_not_called()
+
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_extract_pdf_tables_skips_blank_pages(self, mock_fitz) -> None:
+        """Test pages without text or drawings skip find_tables()."""
+        mock_fitz.version = ["1.18.0"]
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "  \n"
+        mock_page.get_drawings.return_value = []
+        mock_page.get_cdrawings.return_value = []
+        mock_doc.__getitem__.return_value = mock_page
+
+        assert extract_pdf_tables(mock_doc) == []
+        mock_page.find_tables.assert_not_called()
+
+        # force_find_tables bypasses both checks
+        mock_page.find_tables.return_value.tables = []
+        extract_pdf_tables(mock_doc, is_scanned=True, force_find_tables=True)
+        mock_page.find_tables.assert_called_once()
+
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_extract_pdf_tables_shares_drawings(self, mock_fitz) -> None:
+        """Test the page's drawings are read once and passed to find_tables()."""
+        mock_fitz.version = ["1.26.0"]
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+        mock_page = MagicMock()
+        drawings = [{"items": [], "rect": (0, 0, 9, 9)}]
+        mock_page.get_drawings.return_value = drawings
+        mock_page.find_tables.return_value.tables = []
+        mock_doc.__getitem__.return_value = mock_page
+
+        assert extract_pdf_tables(mock_doc) == []
+        mock_page.get_drawings.assert_called_once()
+        mock_page.get_cdrawings.assert_not_called()
+        mock_page.find_tables.assert_called_once_with(paths=drawings)
+
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_extract_pdf_tables_without_paths_support(self, mock_fitz) -> None:
+        """Test find_tables() reads drawings itself before PyMuPDF 1.26.0."""
+        mock_fitz.version = ["1.25.5"]
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+        mock_page = MagicMock()
+        mock_page.get_cdrawings.return_value = [{"items": [], "rect": (0, 0, 9, 9)}]
+        mock_page.find_tables.return_value.tables = []
+        mock_doc.__getitem__.return_value = mock_page
+
+        assert extract_pdf_tables(mock_doc) == []
+        mock_page.get_drawings.assert_not_called()
+        mock_page.find_tables.assert_called_once_with()
+
+    @patch("omniparser.parsers.pdf.tables.PARALLEL_TABLE_MIN_PAGES", 2)
+    def test_extract_pdf_tables_workers_match_sequential(self, tmp_path) -> None:
+        """Test worker processes find the same tables as in-process."""
+        file_path = tmp_path / "tables.pdf"
+        with fitz.open() as doc:
+            for page_num in range(6):
+                page = doc.new_page()
+                for row in range(4):
+                    page.draw_line((72, 100 + row * 20), (300, 100 + row * 20))
+                for x in (72, 180, 300):
+                    page.draw_line((x, 100), (x, 160))
+                for row, cells in enumerate(
+                    [("Page", "Value"), ("A", "1"), ("B", "2")]
+                ):
+                    page.insert_text((80, 115 + row * 20), f"{cells[0]}{page_num}")
+                    page.insert_text((190, 115 + row * 20), cells[1])
+            doc.save(file_path)
+
+        with fitz.open(file_path) as doc:
+            sequential = extract_pdf_tables(doc)
+            parallel = extract_pdf_tables(doc, file_path=file_path, workers=3)
+
+        assert len(sequential) == 6
+        assert parallel == sequential
+
+    @patch("omniparser.parsers.pdf.tables.ProcessPoolExecutor")
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_extract_pdf_tables_small_doc_in_process(
+        self, mock_fitz, mock_pool
+    ) -> None:
+        """Test documents too short to split never start a process pool."""
+        mock_fitz.version = ["1.18.0"]
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_doc.__getitem__.return_value.find_tables.return_value.tables = []
+
+        tables = extract_pdf_tables(mock_doc, file_path=Path("doc.pdf"), workers=4)
+
+        assert tables == []
+        mock_pool.assert_not_called()
+
+
+class TestPageMayContainTables:
+    """Test page_may_contain_tables function."""
+
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_text_only_page_skipped_without_layout(self, mock_fitz) -> None:
+        """Test text without drawings cannot form ruled table cells."""
+        mock_fitz.version = ["1.26.5"]
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "Plain prose paragraph."
+        mock_page.get_cdrawings.return_value = []
+
+        assert page_may_contain_tables(mock_page) is False
+        mock_page.get_text.assert_not_called()
+
+    @patch.dict("sys.modules", {"pymupdf.layout": MagicMock()})
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_text_only_page_kept_with_layout(self, mock_fitz) -> None:
+        """Test layout analysis can find tables in text alone."""
+        mock_fitz.version = ["1.26.6"]
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "Name  Age\nAlice  30"
+
+        assert page_may_contain_tables(mock_page) is True
+        mock_page.get_cdrawings.assert_not_called()
+
+    @patch.dict("sys.modules")
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_text_only_page_skipped_without_layout_import(self, mock_fitz) -> None:
+        """Test the layout analyzer is only used once pymupdf.layout is loaded."""
+        sys.modules.pop("pymupdf.layout", None)
+        mock_fitz.version = ["1.26.6"]
+        mock_page = MagicMock()
+        mock_page.get_cdrawings.return_value = []
+
+        assert page_may_contain_tables(mock_page) is False
+        mock_page.get_text.assert_not_called()
+
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_page_with_drawings_kept(self, mock_fitz) -> None:
+        """Test pages with vector drawings may contain ruled tables."""
+        mock_fitz.version = ["1.26.5"]
+        mock_page = MagicMock()
+        mock_page.get_cdrawings.return_value = [{"items": [], "rect": (0, 0, 9, 9)}]
+
+        assert page_may_contain_tables(mock_page) is True
+
+    @patch("omniparser.parsers.pdf.tables.fitz")
+    def test_given_drawings_used(self, mock_fitz) -> None:
+        """Test drawings already read are used instead of reading them again."""
+        mock_fitz.version = ["1.26.5"]
+        mock_page = MagicMock()
+
+        assert page_may_contain_tables(mock_page, drawings=[]) is False
+        mock_page.get_cdrawings.assert_not_called()
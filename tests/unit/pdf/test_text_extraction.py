@@ -5,18 +5,30 @@ Tests the text extraction functions including scanned PDF detection,
 text extraction with formatting, OCR extraction, and the main coordinator.
 """
 
+import os
+import time
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+import fitz
 import pytest
+from PIL import Image
 
 from omniparser.exceptions import ParsingError
 from omniparser.parsers.pdf.text_extraction import (
+    SPAN_TEXT_FLAGS,
+    _extract_page_spans,
+    binarize_image,
     extract_text_content,
     extract_text_with_formatting,
     extract_text_with_ocr,
     is_scanned_pdf,
+    ocr_images_batched,
+    save_pixmap,
 )
 
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures" / "pdf"
+
 
 class TestIsScannedPdf:
     """Test scanned PDF detection."""
@@ -83,6 +95,53 @@ class TestIsScannedPdf:
         # Empty document should be considered scanned (0 chars < threshold)
         assert result is True
 
+    def test_is_scanned_pdf_image_only_pages(self) -> None:
+        """Test a sample of only image-only pages is scanned."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = ""
+        mock_page.get_images.return_value = [(7, 0, 100, 100)]
+        mock_doc.__getitem__.return_value = mock_page
+
+        assert is_scanned_pdf(mock_doc) is True
+
+    def test_is_scanned_pdf_image_cover_page(self) -> None:
+        """Test an image-only cover page is left out of the average."""
+        cover_page = MagicMock()
+        cover_page.get_text.return_value = ""
+        cover_page.get_images.return_value = [(7, 0, 100, 100)]
+        text_page = MagicMock()
+        text_page.get_text.return_value = "x" * 120
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_doc.__getitem__.side_effect = [cover_page, text_page, text_page]
+
+        # 240 chars over 3 pages would average below the threshold
+        assert is_scanned_pdf(mock_doc) is False
+
+    def test_is_scanned_pdf_text_heavy_first_page(self) -> None:
+        """Test text-heavy first page short-circuits to text-based."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "x" * 300
+        mock_doc.__getitem__.return_value = mock_page
+
+        assert is_scanned_pdf(mock_doc) is False
+        mock_doc.__getitem__.assert_called_once_with(0)
+
+    def test_is_scanned_pdf_stops_once_text_based(self) -> None:
+        """Test sampling stops once earlier pages decide the average."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "x" * 150
+        mock_doc.__getitem__.return_value = mock_page
+
+        assert is_scanned_pdf(mock_doc) is False
+        assert mock_page.get_text.call_count == 2
+
 
 class TestExtractTextWithFormatting:
     """Test text extraction with font information."""
@@ -130,11 +189,11 @@ class TestExtractTextWithFormatting:
         assert "Chapter 1" in text
         assert "This is content" in text
         assert len(blocks) == 2
-        assert blocks[0]["text"] == "Chapter 1"
-        assert blocks[0]["font_size"] == 18.0
-        assert blocks[0]["is_bold"] is True
-        assert blocks[1]["text"] == "This is content"
-        assert blocks[1]["font_size"] == 12.0
+        assert blocks[0].text == "Chapter 1"
+        assert blocks[0].font_size == 18.0
+        assert blocks[0].is_bold is True
+        assert blocks[1].text == "This is content"
+        assert blocks[1].font_size == 12.0
 
     def test_extract_text_with_formatting_empty(self) -> None:
         """Test text extraction with empty PDF."""
@@ -178,8 +237,8 @@ class TestExtractTextWithFormatting:
 
         # Should only process 2 pages
         assert len(blocks) == 2
-        assert blocks[0]["page_num"] == 1
-        assert blocks[1]["page_num"] == 2
+        assert blocks[0].page_num == 1
+        assert blocks[1].page_num == 2
 
     def test_extract_text_with_formatting_page_breaks(self) -> None:
         """Test text extraction with page break markers."""
@@ -249,9 +308,9 @@ class TestExtractTextWithFormatting:
         _, blocks = extract_text_with_formatting(mock_doc)
 
         # First block starts at position 0
-        assert blocks[0]["position"] == 0
+        assert blocks[0].position == 0
         # Second block starts after "First " (5 chars + 1 space = 6)
-        assert blocks[1]["position"] == 6
+        assert blocks[1].position == 6
 
     def test_extract_text_with_formatting_bold_detection(self) -> None:
         """Test bold detection from font flags and name."""
@@ -302,14 +361,130 @@ class TestExtractTextWithFormatting:
 
         _, blocks = extract_text_with_formatting(mock_doc)
 
-        assert blocks[0]["is_bold"] is True
-        assert blocks[1]["is_bold"] is True
-        assert blocks[2]["is_bold"] is False
+        assert blocks[0].is_bold is True
+        assert blocks[1].is_bold is True
+        assert blocks[2].is_bold is False
+
+    def test_extract_text_with_formatting_repeated_fonts(self) -> None:
+        """Test bold-by-name is stable across repeated fonts and skips blanks."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+        mock_page = MagicMock()
+
+        spans = [
+            {"text": text, "size": 12.0, "flags": 0, "font": font}
+            for text, font in [
+                ("One", "Times-Bold"),
+                ("   ", "Times-Bold"),
+                ("Two", "Times-Bold"),
+                ("Three", "Times"),
+                ("Four", "Times"),
+            ]
+        ]
+        mock_page.get_text.return_value = {"blocks": [{"lines": [{"spans": spans}]}]}
+        mock_doc.__getitem__.return_value = mock_page
+
+        text, blocks = extract_text_with_formatting(mock_doc)
+
+        assert text == "One Two Three Four"
+        assert [block.is_bold for block in blocks] == [True, True, False, False]
+
+    def test_extract_text_with_formatting_skips_image_blocks(self) -> None:
+        """Test spans are read without image blocks, matching the full dict."""
+        with fitz.open(FIXTURES_DIR / "EasyBread.pdf") as doc:
+            page = doc[0]
+            assert not SPAN_TEXT_FLAGS & fitz.TEXT_PRESERVE_IMAGES
+            full_dict_spans = [
+                span["text"].strip()
+                for block in page.get_text("dict")["blocks"]
+                for line in block.get("lines", [])
+                for span in line["spans"]
+                if span["text"].strip()
+            ]
+
+            spans = _extract_page_spans(page, {})
+
+        assert [text for text, _, _ in spans] == full_dict_spans
+
+    @patch("omniparser.parsers.pdf.text_extraction.PARALLEL_TEXT_MIN_PAGES", 2)
+    def test_extract_text_with_formatting_workers_match_sequential(self) -> None:
+        """Test worker processes produce the same text and positions."""
+        import fitz
+
+        pdf_path = Path(__file__).parents[2] / "fixtures" / "pdf" / "EasyBread.pdf"
+        with fitz.open(pdf_path) as doc:
+            expected = extract_text_with_formatting(doc, include_page_breaks=True)
+            result = extract_text_with_formatting(
+                doc, include_page_breaks=True, file_path=pdf_path, workers=2
+            )
+
+        assert result == expected
+
+    @patch("omniparser.parsers.pdf.text_extraction.ProcessPoolExecutor")
+    def test_extract_text_with_formatting_small_doc_in_process(self, mock_pool) -> None:
+        """Test short documents skip the process pool."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_doc.__getitem__.return_value.get_text.return_value = {"blocks": []}
+
+        extract_text_with_formatting(
+            mock_doc, file_path=Path("document.pdf"), workers=4
+        )
+
+        mock_pool.assert_not_called()
+
+    def test_extract_text_with_formatting_reuses_sampled_blocks(self) -> None:
+        """Test pages read by is_scanned_pdf() are not laid out again."""
+        with fitz.open(FIXTURES_DIR / "EasyBread.pdf") as doc:
+            num_pages = len(doc)
+            expected = extract_text_with_formatting(doc)
+            page_blocks = {}
+            assert is_scanned_pdf(doc, page_blocks=page_blocks) is False
+            assert 0 in page_blocks
+
+            with patch.object(
+                fitz.Page, "get_text", autospec=True, side_effect=fitz.Page.get_text
+            ) as get_text:
+                result = extract_text_with_formatting(doc, page_blocks=page_blocks)
+
+        assert result == expected
+        assert page_blocks == {}
+        assert get_text.call_count == num_pages - 1
 
 
 class TestExtractTextWithOcr:
     """Test OCR-based text extraction."""
 
+    @pytest.fixture(autouse=True)
+    def failing_batch_ocr(self):
+        """Fail batched Tesseract runs so tests exercise per-page OCR mocks."""
+        import pytesseract
+
+        with patch(
+            "pytesseract.pytesseract.run_tesseract",
+            side_effect=pytesseract.TesseractError(1, "batch failed"),
+        ) as mock_run:
+            yield mock_run
+
+    @patch("omniparser.parsers.pdf.text_extraction.extract_text_with_formatting")
+    @patch("pytesseract.image_to_string")
+    @patch("omniparser.parsers.pdf.text_extraction.Image")
+    def test_extract_text_with_ocr_tesseract_missing(
+        self, mock_image, mock_tesseract, mock_extract, failing_batch_ocr
+    ) -> None:
+        """Test a missing Tesseract binary falls back to text extraction."""
+        import pytesseract
+
+        failing_batch_ocr.side_effect = pytesseract.TesseractNotFoundError()
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_extract.return_value = ("Fallback text", [])
+
+        text = extract_text_with_ocr(mock_doc)
+
+        assert text == "Fallback text"
+        mock_tesseract.assert_not_called()
+
     @patch("pytesseract.image_to_string")
     @patch("omniparser.parsers.pdf.text_extraction.Image")
     def test_extract_text_with_ocr_success(self, mock_image, mock_tesseract) -> None:
@@ -329,7 +504,7 @@ class TestExtractTextWithOcr:
 
         # Mock PIL Image
         mock_img = MagicMock()
-        mock_image.frombytes.return_value = mock_img
+        mock_image.frombuffer.return_value = mock_img
 
         # Mock OCR output
         mock_tesseract.return_value = "OCR extracted text"
@@ -371,20 +546,41 @@ class TestExtractTextWithOcr:
 
         # Mock PIL Image
         mock_img = MagicMock()
-        mock_image.frombytes.return_value = mock_img
-
-        # Mock OCR to simulate timeout
-        def slow_ocr(*args, **kwargs):
-            import time
+        mock_image.frombuffer.return_value = mock_img
 
-            time.sleep(10)
-            return "text"
+        # Mock a hung Tesseract that pytesseract kills after its timeout
+        def slow_ocr(*args, timeout=0, **kwargs):
+            if not 0 < timeout <= 1:
+                time.sleep(10)
+                return "text"
+            time.sleep(timeout)
+            raise RuntimeError("Tesseract process timeout")
 
         mock_tesseract.side_effect = slow_ocr
 
-        # Use very short timeout
+        # Use very short timeout; per-page OCR runs on a worker thread, which
+        # SIGALRM cannot interrupt
+        start = time.monotonic()
         with pytest.raises(ParsingError, match="OCR processing exceeded timeout"):
             extract_text_with_ocr(mock_doc, timeout=1)
+        assert time.monotonic() - start < 3
+
+    @patch("omniparser.parsers.pdf.text_extraction.Deadline.check")
+    @patch("omniparser.parsers.pdf.text_extraction.Image")
+    def test_extract_text_with_ocr_deadline_checked_per_page(
+        self, mock_image, mock_check
+    ) -> None:
+        """Test an expired deadline stops OCR before the next page renders."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_page = MagicMock()
+        mock_doc.__getitem__.return_value = mock_page
+        mock_check.side_effect = [None, TimeoutError("timed out")]
+
+        with pytest.raises(ParsingError, match="OCR processing exceeded timeout"):
+            extract_text_with_ocr(mock_doc, timeout=60)
+
+        assert mock_page.get_pixmap.call_count == 1
 
     @patch("pytesseract.image_to_string")
     @patch("omniparser.parsers.pdf.text_extraction.Image")
@@ -404,7 +600,7 @@ class TestExtractTextWithOcr:
         mock_doc.__getitem__.return_value = mock_page
 
         mock_img = MagicMock()
-        mock_image.frombytes.return_value = mock_img
+        mock_image.frombuffer.return_value = mock_img
         mock_tesseract.return_value = "Page text"
 
         text = extract_text_with_ocr(mock_doc, include_page_breaks=True)
@@ -430,7 +626,7 @@ class TestExtractTextWithOcr:
         mock_doc.__getitem__.return_value = mock_page
 
         mock_img = MagicMock()
-        mock_image.frombytes.return_value = mock_img
+        mock_image.frombuffer.return_value = mock_img
         mock_tesseract.return_value = "Texte francais"
 
         text = extract_text_with_ocr(mock_doc, language="fra")
@@ -439,6 +635,238 @@ class TestExtractTextWithOcr:
         call_kwargs = mock_tesseract.call_args[1]
         assert call_kwargs.get("lang") == "fra"
 
+    @patch("pytesseract.image_to_string")
+    @patch("omniparser.parsers.pdf.text_extraction.Image")
+    def test_extract_text_with_ocr_grayscale_default(
+        self, mock_image, mock_tesseract
+    ) -> None:
+        """Test OCR renders grayscale pixmaps without alpha by default."""
+        import fitz
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+
+        mock_page = MagicMock()
+        mock_pix = MagicMock()
+        mock_pix.width = 800
+        mock_pix.height = 1000
+        mock_pix.samples = b"fake_image_data"
+        mock_page.get_pixmap.return_value = mock_pix
+        mock_doc.__getitem__.return_value = mock_page
+        mock_tesseract.return_value = "Page text"
+
+        extract_text_with_ocr(mock_doc)
+
+        pixmap_kwargs = mock_page.get_pixmap.call_args[1]
+        assert pixmap_kwargs["colorspace"] == fitz.csGRAY
+        assert pixmap_kwargs["alpha"] is False
+        assert mock_image.frombuffer.call_args[0][0] == "L"
+
+    @patch("pytesseract.image_to_string")
+    @patch("omniparser.parsers.pdf.text_extraction.Image")
+    def test_extract_text_with_ocr_rgb_colorspace(
+        self, mock_image, mock_tesseract
+    ) -> None:
+        """Test OCR can still render RGB pixmaps when configured."""
+        import fitz
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+
+        mock_page = MagicMock()
+        mock_pix = MagicMock()
+        mock_pix.width = 800
+        mock_pix.height = 1000
+        mock_pix.samples = b"fake_image_data"
+        mock_page.get_pixmap.return_value = mock_pix
+        mock_doc.__getitem__.return_value = mock_page
+        mock_tesseract.return_value = "Page text"
+
+        extract_text_with_ocr(mock_doc, colorspace="rgb")
+
+        assert mock_page.get_pixmap.call_args[1]["colorspace"] == fitz.csRGB
+        assert mock_image.frombuffer.call_args[0][0] == "RGB"
+
+    def test_extract_text_with_ocr_invalid_colorspace(self) -> None:
+        """Test OCR rejects unsupported colorspaces."""
+        with pytest.raises(ValueError, match="Invalid OCR colorspace"):
+            extract_text_with_ocr(MagicMock(), colorspace="cmyk")
+
+    @patch("pytesseract.image_to_string")
+    @patch("omniparser.parsers.pdf.text_extraction.ocr_images_batched")
+    @patch("omniparser.parsers.pdf.text_extraction.Image")
+    def test_extract_text_with_ocr_page_cache(
+        self, mock_image, mock_batched, mock_tesseract, tmp_path
+    ) -> None:
+        """Test OCR results are cached per page and reused on re-runs."""
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 2
+        mock_page = MagicMock()
+        mock_page.get_pixmap.return_value = MagicMock(width=10, height=10)
+        mock_doc.__getitem__.return_value = mock_page
+        mock_batched.return_value = ["Page one", "Page two"]
+
+        first = extract_text_with_ocr(mock_doc, cache_dir=tmp_path, file_hash="abc123")
+        mock_batched.reset_mock()
+        mock_page.get_pixmap.reset_mock()
+
+        second = extract_text_with_ocr(mock_doc, cache_dir=tmp_path, file_hash="abc123")
+
+        assert first == second == "Page one\nPage two"
+        mock_batched.assert_not_called()
+        mock_page.get_pixmap.assert_not_called()
+
+    @patch("omniparser.parsers.pdf.text_extraction.ocr_images_batched")
+    @patch("omniparser.parsers.pdf.text_extraction.Image")
+    def test_extract_text_with_ocr_resumes_missing_pages(
+        self, mock_image, mock_batched, tmp_path
+    ) -> None:
+        """Test only pages missing from the cache are OCR'd."""
+        from omniparser.parsers.pdf.cache import store_cached_ocr_page
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+        mock_page = MagicMock()
+        mock_page.get_pixmap.return_value = MagicMock(width=10, height=10)
+        mock_doc.__getitem__.return_value = mock_page
+        store_cached_ocr_page(tmp_path, "abc123", 0, 200, "eng", "gray", "Cached")
+        mock_batched.return_value = ["Fresh two", "Fresh three"]
+
+        text = extract_text_with_ocr(mock_doc, cache_dir=tmp_path, file_hash="abc123")
+
+        assert text == "Cached\nFresh two\nFresh three"
+        assert len(mock_batched.call_args[0][0]) == 2
+
+    @patch("omniparser.parsers.pdf.text_extraction.OCR_BATCH_SIZE", 2)
+    @patch("omniparser.parsers.pdf.text_extraction.ocr_images_batched")
+    @patch("omniparser.parsers.pdf.text_extraction.Image")
+    def test_extract_text_with_ocr_workers_keep_page_order(
+        self, mock_image, mock_batched, monkeypatch
+    ) -> None:
+        """Test concurrent chunks are assembled in page order."""
+        monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 5
+        mock_page = MagicMock()
+        mock_page.get_pixmap.return_value = MagicMock(width=10, height=10)
+        mock_doc.__getitem__.return_value = mock_page
+        thread_limits = []
+
+        def fake_batched(paths, *args):
+            thread_limits.append(os.environ.get("OMP_THREAD_LIMIT"))
+            return [p.stem for p in paths]
+
+        mock_batched.side_effect = fake_batched
+
+        text = extract_text_with_ocr(mock_doc, workers=3)
+
+        assert text.split("\n") == [f"page_{n:04d}" for n in range(1, 6)]
+        assert mock_batched.call_count == 3
+        assert thread_limits == ["1", "1", "1"]
+        assert "OMP_THREAD_LIMIT" not in os.environ
+
+    @patch("omniparser.parsers.pdf.text_extraction.ocr_images_batched")
+    @patch("omniparser.parsers.pdf.text_extraction.Image")
+    def test_extract_text_with_ocr_workers_respect_thread_limit(
+        self, mock_image, mock_batched, monkeypatch
+    ) -> None:
+        """Test a user-set OMP_THREAD_LIMIT is left unchanged."""
+        monkeypatch.setenv("OMP_THREAD_LIMIT", "4")
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+        mock_batched.return_value = ["Text"]
+
+        extract_text_with_ocr(mock_doc, workers=2)
+
+        assert os.environ["OMP_THREAD_LIMIT"] == "4"
+
+
+class TestSavePixmap:
+    """Test zero-copy saving of rendered OCR pages."""
+
+    @pytest.mark.parametrize(
+        "colorspace, mode", [(fitz.csGRAY, "L"), (fitz.csRGB, "RGB")]
+    )
+    def test_save_pixmap_matches_copy(self, colorspace, mode, tmp_path) -> None:
+        """Test the saved image matches a copied pixel buffer."""
+        with fitz.open(FIXTURES_DIR / "EasyBread.pdf") as doc:
+            pix = doc[0].get_pixmap(dpi=36, colorspace=colorspace, alpha=False)
+        image_path = tmp_path / "page.png"
+
+        save_pixmap(pix, mode, image_path)
+
+        expected = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+        with Image.open(image_path) as saved:
+            assert saved.mode == mode
+            assert saved.tobytes() == expected.tobytes()
+            assert saved.info["dpi"] == pytest.approx((36, 36), abs=0.01)
+
+    def test_save_pixmap_binary(self, tmp_path) -> None:
+        """Test binary mode saves a one-bit image of a grayscale pixmap."""
+        with fitz.open(FIXTURES_DIR / "EasyBread.pdf") as doc:
+            pix = doc[0].get_pixmap(dpi=36, colorspace=fitz.csGRAY, alpha=False)
+        image_path = tmp_path / "page.png"
+
+        save_pixmap(pix, "1", image_path)
+
+        gray = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        with Image.open(image_path) as saved:
+            assert saved.mode == "1"
+            assert saved.tobytes() == binarize_image(gray).tobytes()
+
+
+class TestBinarizeImage:
+    """Test Otsu binarization of OCR page images."""
+
+    def test_threshold_separates_two_levels(self) -> None:
+        """Test dark and light pixels map to black and white."""
+        img = Image.new("L", (4, 1))
+        img.putdata([20, 40, 200, 230])
+
+        binary = binarize_image(img)
+
+        assert binary.mode == "1"
+        assert binary.convert("L").tobytes() == bytes([0, 0, 255, 255])
+
+    def test_uniform_image(self) -> None:
+        """Test a single-level image stays uniform."""
+        binary = binarize_image(Image.new("L", (3, 3), 255))
+        assert binary.convert("L").tobytes() == bytes([255] * 9)
+
+
+class TestOcrImagesBatched:
+    """Test single-invocation Tesseract OCR over an image list."""
+
+    @patch("pytesseract.pytesseract.run_tesseract")
+    def test_ocr_images_batched_splits_pages(self, mock_run, tmp_path) -> None:
+        """Test Tesseract output is split into one entry per page."""
+        image_paths = [tmp_path / "page_0001.png", tmp_path / "page_0002.png"]
+
+        def fake_run(input_filename, output_base, **kwargs):
+            (tmp_path / "ocr_output.txt").write_text("First\fSecond\f")
+
+        mock_run.side_effect = fake_run
+
+        texts = ocr_images_batched(image_paths, tmp_path, language="deu")
+
+        assert texts == ["First", "Second"]
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[1]["lang"] == "deu"
+        image_list = (tmp_path / "pages.txt").read_text().splitlines()
+        assert image_list == [str(path) for path in image_paths]
+
+    @patch("pytesseract.pytesseract.run_tesseract")
+    def test_ocr_images_batched_timeout(self, mock_run, tmp_path) -> None:
+        """Test a killed Tesseract process is reported as TimeoutError."""
+        mock_run.side_effect = RuntimeError("Tesseract process timeout")
+
+        with pytest.raises(TimeoutError):
+            ocr_images_batched([tmp_path / "page_0001.png"], tmp_path, timeout=1)
+
+    def test_ocr_images_batched_empty(self, tmp_path) -> None:
+        """Test empty image list needs no Tesseract run."""
+        assert ocr_images_batched([], tmp_path) == []
+
 
 class TestExtractTextContent:
     """Test main text extraction coordinator."""
@@ -504,7 +932,7 @@ class TestExtractTextContent:
         extract_text_content(mock_doc, ocr_threshold=50)
 
         # Verify threshold was passed to is_scanned_pdf
-        mock_is_scanned.assert_called_once_with(mock_doc, threshold=50)
+        mock_is_scanned.assert_called_once_with(mock_doc, threshold=50, page_blocks={})
 
     @patch("omniparser.parsers.pdf.text_extraction.extract_text_with_ocr")
     @patch("omniparser.parsers.pdf.text_extraction.is_scanned_pdf")
@@ -523,6 +951,7 @@ class TestExtractTextContent:
             ocr_language="deu",
             max_pages=10,
             include_page_breaks=True,
+            ocr_dpi=300,
         )
 
         # Verify options were passed to OCR function
@@ -531,3 +960,5 @@ class TestExtractTextContent:
         assert call_kwargs["language"] == "deu"
         assert call_kwargs["max_pages"] == 10
         assert call_kwargs["include_page_breaks"] is True
+        assert call_kwargs["colorspace"] == "gray"
+        assert call_kwargs["dpi"] == 300
@@ -6,19 +6,46 @@ timeout enforcement, word counting, and reading time estimation.
 """
 
 import signal
+import threading
 import time
 from unittest.mock import patch
 
+import fitz
 import pytest
 
 from omniparser.parsers.pdf.utils import (
     READING_SPEED_WPM,
+    Deadline,
     count_words,
     estimate_reading_time,
+    quiet_mupdf_errors,
     timeout_context,
+    trim_mupdf_store,
 )
 
 
+class TestDeadline:
+    """Test Deadline class."""
+
+    def test_deadline_not_expired(self) -> None:
+        """Test check() passes before the deadline."""
+        deadline = Deadline(10)
+
+        deadline.check()
+        assert not deadline.expired()
+        assert 0 < deadline.remaining() <= 10
+
+    def test_deadline_expired(self) -> None:
+        """Test check() raises once the deadline has passed."""
+        deadline = Deadline(0.01)
+        time.sleep(0.02)
+
+        assert deadline.expired()
+        assert deadline.remaining() == 0.0
+        with pytest.raises(TimeoutError, match="timed out after 0.01 seconds"):
+            deadline.check()
+
+
 class TestTimeoutContext:
     """Test timeout_context function."""
 
@@ -42,6 +69,18 @@ class TestTimeoutContext:
             time.sleep(0.1)
         # Should complete without exception
 
+    @pytest.mark.skipif(
+        not hasattr(signal, "SIGALRM"),
+        reason="SIGALRM not available on this platform",
+    )
+    def test_timeout_context_fractional_seconds(self) -> None:
+        """Test sub-second timeouts are enforced without rounding."""
+        start = time.monotonic()
+        with pytest.raises(TimeoutError, match="timed out after 0.2 seconds"):
+            with timeout_context(0.2):
+                time.sleep(2)
+        assert time.monotonic() - start < 1.0
+
     @pytest.mark.skipif(
         hasattr(signal, "SIGALRM"), reason="Test only for platforms without SIGALRM"
     )
@@ -52,6 +91,68 @@ class TestTimeoutContext:
                 pass
             mock_logger.warning.assert_called_once()
 
+    def test_timeout_context_yields_deadline(self) -> None:
+        """Test timeout context yields a Deadline for the same budget."""
+        with timeout_context(5) as deadline:
+            assert isinstance(deadline, Deadline)
+            assert deadline.seconds == 5
+            deadline.check()
+
+    def test_timeout_context_deadline_without_sigalrm(self) -> None:
+        """Test deadline checks still enforce the timeout without SIGALRM."""
+        with patch("omniparser.parsers.pdf.utils.signal", spec=[]):
+            with pytest.raises(TimeoutError):
+                with timeout_context(0.01) as deadline:
+                    time.sleep(0.02)
+                    deadline.check()
+
+    @pytest.mark.skipif(
+        not hasattr(signal, "SIGALRM"),
+        reason="SIGALRM not available on this platform",
+    )
+    def test_timeout_context_nested_installs_handler_once(self) -> None:
+        """Test nested contexts keep one handler until the outermost exits."""
+        original_handler = signal.getsignal(signal.SIGALRM)
+
+        with timeout_context(1):
+            handler = signal.getsignal(signal.SIGALRM)
+            with patch("omniparser.parsers.pdf.utils.signal.signal") as mock_signal:
+                with timeout_context(1):
+                    assert signal.getitimer(signal.ITIMER_REAL)[0] > 0
+                mock_signal.assert_not_called()
+            assert signal.getsignal(signal.SIGALRM) is handler
+
+        assert signal.getsignal(signal.SIGALRM) is original_handler
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+    @pytest.mark.skipif(
+        not hasattr(signal, "SIGALRM"),
+        reason="SIGALRM not available on this platform",
+    )
+    def test_timeout_context_nested(self) -> None:
+        """Test an inner context re-arms the outer deadline on exit."""
+        with pytest.raises(TimeoutError, match="timed out after 0.3 seconds"):
+            with timeout_context(0.3):
+                with timeout_context(5):
+                    # The outer deadline is shorter, so the timer uses it
+                    assert signal.getitimer(signal.ITIMER_REAL)[0] <= 0.3
+                time.sleep(2)
+
+    def test_timeout_context_worker_thread(self) -> None:
+        """Test worker threads fall back to deadline polling."""
+        results = []
+
+        def worker() -> None:
+            with timeout_context(0.01) as deadline:
+                time.sleep(0.02)
+                results.append(deadline.expired())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert results == [True]
+
     @pytest.mark.skipif(
         not hasattr(signal, "SIGALRM"),
         reason="SIGALRM not available on this platform",
@@ -71,6 +172,29 @@ class TestTimeoutContext:
         assert current_handler == original_handler
 
 
+class TestQuietMupdfErrors:
+    """Test quiet_mupdf_errors context manager."""
+
+    def test_quiet_mupdf_errors_restores_setting(self) -> None:
+        """Test MuPDF errors are silenced inside and restored on exit."""
+        previous = fitz.TOOLS.mupdf_display_errors()
+        try:
+            fitz.TOOLS.mupdf_display_errors(True)
+            with quiet_mupdf_errors():
+                assert fitz.TOOLS.mupdf_display_errors() is False
+            assert fitz.TOOLS.mupdf_display_errors() is True
+        finally:
+            fitz.TOOLS.mupdf_display_errors(previous)
+
+    def test_quiet_mupdf_errors_restores_on_error(self) -> None:
+        """Test the setting is restored when the body raises."""
+        previous = fitz.TOOLS.mupdf_display_errors()
+        with pytest.raises(ValueError):
+            with quiet_mupdf_errors():
+                raise ValueError("boom")
+        assert fitz.TOOLS.mupdf_display_errors() == previous
+
+
 class TestCountWords:
     """Test count_words function."""
 
@@ -85,6 +209,25 @@ class TestCountWords:
         assert count_words("   ") == 0
         assert count_words("\n\n\t") == 0
 
+    def test_count_words_matches_split(self) -> None:
+        """Test the ASCII fast path agrees with str.split() on every character."""
+        for code in range(128):
+            text = f"a{chr(code)}b {chr(code)}c{chr(code)}"
+            assert count_words(text) == len(text.split()), repr(chr(code))
+
+    def test_count_words_across_chunks(self) -> None:
+        """Test words split by, or ending at, chunk boundaries count once."""
+        with patch("omniparser.parsers.pdf.utils.WORD_COUNT_CHUNK_SIZE", 4):
+            assert count_words("abcdefgh ij") == 2
+            assert count_words("abc defg hij") == 3
+            assert count_words("abcd    efgh") == 2
+            assert count_words("    ") == 0
+
+    def test_count_words_non_ascii(self) -> None:
+        """Test non-ASCII text, including Unicode whitespace."""
+        assert count_words("café crème brûlée") == 3
+        assert count_words("one\u00a0two\u2003three") == 3
+
     def test_count_words_with_punctuation(self) -> None:
         """Test word counting with punctuation."""
         assert count_words("Hello, world! How are you?") == 5
@@ -139,3 +282,17 @@ class TestEstimateReadingTime:
         assert estimate_reading_time(375) == 1
         # 625 words / 250 wpm = 2.5, should round down to 2
         assert estimate_reading_time(625) == 2
+
+
+class TestTrimMupdfStore:
+    """Test periodic flushing of MuPDF's resource store."""
+
+    @patch("omniparser.parsers.pdf.utils.STORE_TRIM_INTERVAL", 10)
+    @patch("fitz.TOOLS.store_shrink")
+    def test_trim_mupdf_store_every_interval(self, mock_shrink) -> None:
+        """Test the store is emptied once per interval of pages."""
+        for pages_rendered in range(1, 26):
+            trim_mupdf_store(pages_rendered)
+
+        assert mock_shrink.call_count == 2
+        mock_shrink.assert_called_with(100)
@@ -7,12 +7,15 @@ functions for various success and error scenarios.
 
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from omniparser.exceptions import FileReadError, ValidationError
 from omniparser.parsers.pdf.validation import (
+    clear_pdf_cache,
+    close_pdf_document,
+    load_cached_pdf_document,
     load_pdf_document,
     validate_and_load_pdf,
     validate_pdf_file,
@@ -49,6 +52,17 @@ class TestValidatePdfFile:
         finally:
             tmp_path.unlink()
 
+    def test_validate_pdf_file_extension_case(self, tmp_path) -> None:
+        """Test the extension check is case-insensitive and needs a stem."""
+        upper = tmp_path / "REPORT.PDF"
+        upper.write_bytes(b"%PDF-1.4")
+        validate_pdf_file(upper)
+
+        bare = tmp_path / ".pdf"
+        bare.write_bytes(b"%PDF-1.4")
+        with pytest.raises(ValidationError, match="Not a PDF file"):
+            validate_pdf_file(bare)
+
     def test_validate_pdf_file_is_directory(self) -> None:
         """Test validation fails for directory."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -56,6 +70,32 @@ class TestValidatePdfFile:
             with pytest.raises(ValidationError, match="Not a file"):
                 validate_pdf_file(dir_path)
 
+    def test_validate_pdf_file_single_stat(self, tmp_path) -> None:
+        """Test validation issues one stat() call and no other path checks."""
+        pdf_path = tmp_path / "single.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+
+        real_stat = pdf_path.stat()
+
+        with patch.object(Path, "stat", return_value=real_stat) as mock_stat:
+            with patch.object(Path, "exists") as mock_exists:
+                with patch.object(Path, "is_file") as mock_is_file:
+                    validate_pdf_file(pdf_path)
+
+        mock_stat.assert_called_once()
+        mock_exists.assert_not_called()
+        mock_is_file.assert_not_called()
+
+    def test_validate_pdf_file_deleted(self, tmp_path) -> None:
+        """Test a file deleted after validation is reported as not found."""
+        pdf_path = tmp_path / "deleted.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        validate_pdf_file(pdf_path)
+        pdf_path.unlink()
+
+        with pytest.raises(ValidationError, match="File not found"):
+            validate_pdf_file(pdf_path)
+
 
 class TestLoadPdfDocument:
     """Test load_pdf_document function."""
@@ -67,6 +107,7 @@ class TestLoadPdfDocument:
         mock_doc = mock_fitz.open.return_value
 
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            tmp.write(b"%PDF-1.4")
             tmp_path = Path(tmp.name)
 
         try:
@@ -86,6 +127,7 @@ class TestLoadPdfDocument:
         mock_fitz.open.side_effect = Exception("PDF is corrupted")
 
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            tmp.write(b"%PDF-1.4")
             tmp_path = Path(tmp.name)
 
         try:
@@ -94,6 +136,88 @@ class TestLoadPdfDocument:
         finally:
             tmp_path.unlink()
 
+    @patch("omniparser.parsers.pdf.validation.fitz")
+    def test_load_pdf_document_not_pdf_stream(self, mock_fitz, tmp_path) -> None:
+        """Test files without a PDF header are rejected before fitz.open."""
+        fake_pdf = tmp_path / "image.pdf"
+        fake_pdf.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\0" * 64)
+
+        with pytest.raises(FileReadError, match="Not a PDF stream"):
+            load_pdf_document(fake_pdf)
+
+        mock_fitz.open.assert_not_called()
+
+    @patch("omniparser.parsers.pdf.validation.fitz")
+    def test_load_pdf_document_header_after_junk(self, mock_fitz, tmp_path) -> None:
+        """Test a header preceded by leading junk is still accepted."""
+        pdf_path = tmp_path / "junk.pdf"
+        pdf_path.write_bytes(b"\r\n" * 10 + b"%PDF-1.7\n")
+
+        load_pdf_document(pdf_path)
+
+        mock_fitz.open.assert_called_once_with(pdf_path)
+
+    def test_load_pdf_document_mmap(self) -> None:
+        """Test large PDFs are opened from a memory-mapped buffer."""
+        pdf_path = Path(__file__).parents[2] / "fixtures" / "pdf" / "EasyBread.pdf"
+
+        with patch("omniparser.parsers.pdf.validation.MMAP_MIN_FILE_SIZE", 0):
+            doc = load_pdf_document(pdf_path, use_mmap=True)
+
+        try:
+            assert isinstance(doc.stream, memoryview)
+            assert len(doc) > 0
+            assert doc[0].get_text()
+        finally:
+            close_pdf_document(doc)
+
+    def test_load_pdf_document_mmap_opt_in(self) -> None:
+        """Test PDFs are opened by path unless mmap is requested."""
+        pdf_path = Path(__file__).parents[2] / "fixtures" / "pdf" / "EasyBread.pdf"
+
+        with patch("omniparser.parsers.pdf.validation.MMAP_MIN_FILE_SIZE", 0):
+            doc = load_pdf_document(pdf_path)
+
+        try:
+            assert not hasattr(doc, "_omniparser_mmap")
+            assert doc.name == str(pdf_path)
+        finally:
+            close_pdf_document(doc)
+
+    def test_close_pdf_document_unmaps_file(self) -> None:
+        """Test closing a memory-mapped PDF releases the mapping."""
+        pdf_path = Path(__file__).parents[2] / "fixtures" / "pdf" / "EasyBread.pdf"
+
+        with patch("omniparser.parsers.pdf.validation.MMAP_MIN_FILE_SIZE", 0):
+            doc = load_pdf_document(pdf_path, use_mmap=True)
+        mapped = doc._omniparser_mmap
+
+        close_pdf_document(doc)
+
+        assert doc.is_closed
+        assert mapped.closed
+
+    def test_close_pdf_document_without_mmap(self) -> None:
+        """Test documents opened by path are simply closed."""
+        doc = MagicMock(spec=["close"])
+
+        close_pdf_document(doc)
+
+        doc.close.assert_called_once()
+
+    @patch("omniparser.parsers.pdf.validation.fitz")
+    def test_load_pdf_document_small_file_skips_mmap(self, mock_fitz) -> None:
+        """Test files below the mmap threshold are opened by path."""
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            tmp.write(b"%PDF-1.4")
+            tmp_path = Path(tmp.name)
+
+        try:
+            load_pdf_document(tmp_path, use_mmap=True)
+            mock_fitz.open.assert_called_once_with(tmp_path)
+        finally:
+            tmp_path.unlink()
+
 
 class TestValidateAndLoadPdf:
     """Test validate_and_load_pdf function."""
@@ -105,6 +229,7 @@ class TestValidateAndLoadPdf:
         mock_doc = mock_fitz.open.return_value
 
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            tmp.write(b"%PDF-1.4")
             tmp_path = Path(tmp.name)
 
         try:
@@ -130,6 +255,7 @@ class TestValidateAndLoadPdf:
         mock_fitz.open.side_effect = Exception("Cannot read PDF")
 
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            tmp.write(b"%PDF-1.4")
             tmp_path = Path(tmp.name)
 
         try:
@@ -137,3 +263,72 @@ class TestValidateAndLoadPdf:
                 validate_and_load_pdf(tmp_path)
         finally:
             tmp_path.unlink()
+
+
+class TestLoadCachedPdfDocument:
+    """Test load_cached_pdf_document and clear_pdf_cache functions."""
+
+    def setup_method(self) -> None:
+        clear_pdf_cache()
+
+    def teardown_method(self) -> None:
+        clear_pdf_cache()
+
+    @patch("omniparser.parsers.pdf.validation.fitz")
+    def test_load_cached_pdf_document_reused(self, mock_fitz, tmp_path) -> None:
+        """Test an unchanged file is opened once and the document shared."""
+        pdf_path = tmp_path / "shared.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        mock_fitz.open.return_value.is_closed = False
+
+        first = load_cached_pdf_document(pdf_path)
+        second = load_cached_pdf_document(pdf_path)
+
+        assert first is second
+        mock_fitz.open.assert_called_once_with(pdf_path)
+
+    @patch("omniparser.parsers.pdf.validation.fitz")
+    def test_load_cached_pdf_document_modified(self, mock_fitz, tmp_path) -> None:
+        """Test a modified or closed document is opened again."""
+        pdf_path = tmp_path / "changing.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        docs = [MagicMock(is_closed=False) for _ in range(3)]
+        mock_fitz.open.side_effect = docs
+
+        assert load_cached_pdf_document(pdf_path) is docs[0]
+        pdf_path.write_bytes(b"%PDF-1.7 changed")
+        assert load_cached_pdf_document(pdf_path) is docs[1]
+        docs[1].is_closed = True
+        assert load_cached_pdf_document(pdf_path) is docs[2]
+
+    @patch("omniparser.parsers.pdf.validation.DOCUMENT_CACHE_SIZE", 1)
+    @patch("omniparser.parsers.pdf.validation.fitz")
+    def test_load_cached_pdf_document_evicts(self, mock_fitz, tmp_path) -> None:
+        """Test the least recently used document is evicted and closed."""
+        paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+        for path in paths:
+            path.write_bytes(b"%PDF-1.4")
+        docs = [MagicMock(is_closed=False) for _ in range(3)]
+        mock_fitz.open.side_effect = docs
+
+        load_cached_pdf_document(paths[0])
+        load_cached_pdf_document(paths[1])
+
+        docs[0].close.assert_called_once()
+        docs[1].close.assert_not_called()
+        assert load_cached_pdf_document(paths[0]) is docs[2]
+        docs[1].close.assert_called_once()
+
+    @patch("omniparser.parsers.pdf.validation.fitz")
+    def test_clear_pdf_cache(self, mock_fitz, tmp_path) -> None:
+        """Test clearing the cache forces the next load to reopen."""
+        pdf_path = tmp_path / "cleared.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        mock_fitz.open.return_value.is_closed = False
+
+        load_cached_pdf_document(pdf_path)
+        clear_pdf_cache()
+        mock_fitz.open.return_value.close.assert_called_once()
+        load_cached_pdf_document(pdf_path)
+
+        assert mock_fitz.open.call_count == 2
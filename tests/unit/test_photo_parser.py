@@ -10,8 +10,12 @@ Tests the photo parser functionality:
 - Integration with main parser
 """
 
+import os
+import struct
 import tempfile
+import zlib
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from PIL import Image
@@ -27,6 +31,8 @@ from omniparser.parsers.photo import (
     GPSInfo,
 )
 from omniparser.exceptions import ValidationError
+from omniparser.parsers.photo import cache as photo_cache
+from omniparser.parsers.photo.metadata import clear_metadata_cache
 
 
 # Test fixtures directory
@@ -145,6 +151,122 @@ class TestExtractPhotoMetadata:
             Path(f.name).unlink()
 
 
+class TestPhotoMetadataCache:
+    """Test suite for memoized and on-disk cached photo metadata."""
+
+    def setup_method(self):
+        """Start every test with an empty in-process memo."""
+        clear_metadata_cache()
+
+    def _make_photo(self, tmp_path, size=(64, 48)):
+        photo_path = tmp_path / "photo.png"
+        Image.new("RGB", size, color="green").save(photo_path)
+        return photo_path
+
+    def test_repeated_read_skips_pil(self, tmp_path, monkeypatch):
+        """Test an unchanged file is only opened once per process."""
+        monkeypatch.delenv(photo_cache.EXIF_CACHE_ENV_VAR, raising=False)
+        photo_path = self._make_photo(tmp_path)
+
+        with patch(
+            "omniparser.parsers.photo.metadata.Image.open", wraps=Image.open
+        ) as mock_open:
+            first = extract_photo_metadata(photo_path)
+            second = extract_photo_metadata(str(photo_path))
+
+        assert mock_open.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_changed_file_is_reread(self, tmp_path, monkeypatch):
+        """Test a modified file is read again instead of served stale."""
+        monkeypatch.delenv(photo_cache.EXIF_CACHE_ENV_VAR, raising=False)
+        photo_path = self._make_photo(tmp_path)
+        assert extract_photo_metadata(photo_path).width == 64
+
+        self._make_photo(tmp_path, size=(32, 16))
+        stat = photo_path.stat()
+        os.utime(photo_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert extract_photo_metadata(photo_path).width == 32
+
+    def test_disk_cache_hit_skips_pil(self, tmp_path, monkeypatch):
+        """Test metadata cached on disk is reused by a fresh process memo."""
+        monkeypatch.setenv(photo_cache.EXIF_CACHE_ENV_VAR, "1")
+        monkeypatch.setattr(
+            photo_cache, "DEFAULT_EXIF_CACHE_PATH", tmp_path / "cache" / "exif.db"
+        )
+        photo_path = self._make_photo(tmp_path)
+        expected = extract_photo_metadata(photo_path)
+        assert (tmp_path / "cache" / "exif.db").exists()
+
+        clear_metadata_cache()
+        with patch("omniparser.parsers.photo.metadata.Image.open") as mock_open:
+            cached = extract_photo_metadata(photo_path)
+
+        mock_open.assert_not_called()
+        assert cached == expected
+
+    def test_disk_cache_disabled_by_default(self, tmp_path, monkeypatch):
+        """Test nothing is written to disk unless the cache is enabled."""
+        monkeypatch.delenv(photo_cache.EXIF_CACHE_ENV_VAR, raising=False)
+        monkeypatch.setattr(
+            photo_cache, "DEFAULT_EXIF_CACHE_PATH", tmp_path / "cache" / "exif.db"
+        )
+        extract_photo_metadata(self._make_photo(tmp_path))
+
+        assert not (tmp_path / "cache").exists()
+
+
+class TestExifExtraction:
+    """Test suite for reading EXIF tags across image formats."""
+
+    def setup_method(self):
+        """Start every test with an empty in-process memo."""
+        clear_metadata_cache()
+
+    def _make_exif(self):
+        exif = Image.Exif()
+        exif[0x010F] = "TestCam"  # Make
+        exif.get_ifd(0x8769)[0x9003] = "2024:05:01 12:00:00"  # DateTimeOriginal
+        return exif
+
+    def test_tiff_exif_is_read(self, tmp_path):
+        """Test EXIF is read from TIFF files."""
+        photo_path = tmp_path / "photo.tiff"
+        Image.new("RGB", (8, 8)).save(photo_path, exif=self._make_exif())
+
+        assert extract_photo_metadata(photo_path).camera.make == "TestCam"
+
+    def test_png_exif_after_image_data(self, tmp_path):
+        """Test an eXIf chunk placed after the image data is still found."""
+        photo_path = tmp_path / "photo.png"
+        Image.new("RGB", (8, 8)).save(photo_path)
+        exif_data = self._make_exif().tobytes()
+        chunk = (
+            struct.pack(">I", len(exif_data))
+            + b"eXIf"
+            + exif_data
+            + struct.pack(">I", zlib.crc32(b"eXIf" + exif_data))
+        )
+        data = photo_path.read_bytes()
+        iend = data.rindex(b"IEND") - 4
+        photo_path.write_bytes(data[:iend] + chunk + data[iend:])
+
+        assert extract_photo_metadata(photo_path).camera.make == "TestCam"
+
+    def test_png_without_exif_is_not_decoded(self, tmp_path):
+        """Test PNGs without EXIF are not decoded just to look for it."""
+        photo_path = tmp_path / "photo.png"
+        Image.new("RGB", (8, 8)).save(photo_path)
+
+        with patch("PIL.PngImagePlugin.PngImageFile.load") as mock_load:
+            metadata = extract_photo_metadata(photo_path)
+
+        mock_load.assert_not_called()
+        assert metadata.raw_exif == {}
+
+
 class TestParsePhoto:
     """Test suite for parse_photo function."""
 
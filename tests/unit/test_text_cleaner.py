@@ -213,6 +213,18 @@ class TestPunctuationTransformation:
         assert "\u2019" not in result  # Right single quote
         assert result.count("'") >= 2
 
+    def test_character_table_replaces_single_characters(self) -> None:
+        """Test single-character replacements are loaded as a translate table."""
+        table = load_patterns()["character_table"]
+        assert table[ord("\u2014")] == " -- "
+        assert table[ord("\u00a0")] == " "
+
+    def test_character_table_applied_before_patterns(self) -> None:
+        """Test translated characters are seen by the transformation patterns."""
+        text = "\u201cWait\u2014what\u2026\u201d said\u00a0 \u2018no\u2019"
+        result = _apply_transformation_patterns(text)
+        assert result == "\"Wait -- what...\" said 'no'"
+
 
 class TestWhitespaceNormalization:
     """Tests for whitespace normalization."""